@@ -28,7 +28,6 @@ def upgrade() -> None:
         sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
     op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
 
     # Create profiles table
@@ -44,15 +43,12 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('user_id')
     )
-    op.create_index(op.f('ix_profiles_id'), 'profiles', ['id'], unique=False)
 
 
 def downgrade() -> None:
     # Drop tables in reverse order
-    op.drop_index(op.f('ix_profiles_id'), table_name='profiles')
     op.drop_table('profiles')
     op.execute('DROP TYPE IF EXISTS userrole')
 
     op.drop_index(op.f('ix_users_email'), table_name='users')
-    op.drop_index(op.f('ix_users_id'), table_name='users')
     op.drop_table('users')
@@ -15,8 +15,15 @@ down_revision = '000_initial_schema'
 branch_labels = None
 depends_on = None
 
+challenge_status = postgresql.ENUM('NOT_STARTED', 'IN_PROGRESS', 'COMPLETE', name='challengestatus', create_type=False)
+objective_status = postgresql.ENUM('INCOMPLETE', 'COMPLETE', name='objectivestatus', create_type=False)
+
 
 def upgrade() -> None:
+    # Create enums
+    challenge_status.create(op.get_bind(), checkfirst=True)
+    objective_status.create(op.get_bind(), checkfirst=True)
+
     # Create challenges table
     op.create_table(
         'challenges',
@@ -29,7 +36,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_challenges_id'), 'challenges', ['id'], unique=False)
 
     # Create objectives table
     op.create_table(
@@ -44,7 +50,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['challenge_id'], ['challenges.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_objectives_id'), 'objectives', ['id'], unique=False)
 
     # Create challenge_links table
     op.create_table(
@@ -58,7 +63,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('from_challenge_id', 'condition', name='uq_challenge_link_condition')
     )
-    op.create_index(op.f('ix_challenge_links_id'), 'challenge_links', ['id'], unique=False)
 
     # Create user_challenge_progress table
     op.create_table(
@@ -66,7 +70,7 @@ def upgrade() -> None:
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('user_id', sa.Integer(), nullable=False),
         sa.Column('challenge_id', sa.Integer(), nullable=False),
-        sa.Column('status', sa.Enum('NOT_STARTED', 'IN_PROGRESS', 'COMPLETE', name='challengestatus'), nullable=False, server_default='NOT_STARTED'),
+        sa.Column('status', challenge_status, nullable=False, server_default='NOT_STARTED'),
         sa.Column('started_at', sa.DateTime(), nullable=True),
         sa.Column('completed_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
@@ -74,7 +78,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('user_id', 'challenge_id', name='uq_user_challenge')
     )
-    op.create_index(op.f('ix_user_challenge_progress_id'), 'user_challenge_progress', ['id'], unique=False)
 
     # Create user_objective_progress table
     op.create_table(
@@ -82,33 +85,23 @@ def upgrade() -> None:
         sa.Column('id', sa.Integer(), nullable=False),
         sa.Column('user_id', sa.Integer(), nullable=False),
         sa.Column('objective_id', sa.Integer(), nullable=False),
-        sa.Column('status', sa.Enum('INCOMPLETE', 'COMPLETE', name='objectivestatus'), nullable=False, server_default='INCOMPLETE'),
+        sa.Column('status', objective_status, nullable=False, server_default='INCOMPLETE'),
         sa.Column('completed_at', sa.DateTime(), nullable=True),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
         sa.ForeignKeyConstraint(['objective_id'], ['objectives.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('user_id', 'objective_id', name='uq_user_objective')
     )
-    op.create_index(op.f('ix_user_objective_progress_id'), 'user_objective_progress', ['id'], unique=False)
 
 
 def downgrade() -> None:
     # Drop tables in reverse order
-    op.drop_index(op.f('ix_user_objective_progress_id'), table_name='user_objective_progress')
     op.drop_table('user_objective_progress')
-
-    op.drop_index(op.f('ix_user_challenge_progress_id'), table_name='user_challenge_progress')
     op.drop_table('user_challenge_progress')
-
-    op.drop_index(op.f('ix_challenge_links_id'), table_name='challenge_links')
     op.drop_table('challenge_links')
-
-    op.drop_index(op.f('ix_objectives_id'), table_name='objectives')
     op.drop_table('objectives')
-
-    op.drop_index(op.f('ix_challenges_id'), table_name='challenges')
     op.drop_table('challenges')
 
     # Drop enums
-    op.execute('DROP TYPE IF EXISTS challengestatus')
-    op.execute('DROP TYPE IF EXISTS objectivestatus')
+    challenge_status.drop(op.get_bind(), checkfirst=True)
+    objective_status.drop(op.get_bind(), checkfirst=True)
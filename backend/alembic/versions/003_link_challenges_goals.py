@@ -17,26 +17,28 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add goal_id to challenges table
-    op.add_column('challenges', sa.Column('goal_id', sa.Integer(), nullable=True))
-    op.create_foreign_key('fk_challenges_goal_id', 'challenges', 'goals', ['goal_id'], ['id'], ondelete='SET NULL')
-
-    # Add next_challenge_id for chaining
-    op.add_column('challenges', sa.Column('next_challenge_id', sa.Integer(), nullable=True))
-    op.create_foreign_key('fk_challenges_next_challenge_id', 'challenges', 'challenges', ['next_challenge_id'], ['id'], ondelete='SET NULL')
-
-    # Add sort_order for ordering within a goal
-    op.add_column('challenges', sa.Column('sort_order', sa.Integer(), nullable=False, server_default='0'))
-
-    # Add visible_to_students flag
-    op.add_column('challenges', sa.Column('visible_to_students', sa.Boolean(), nullable=False, server_default='true'))
-
-    # Add points field (moved from objectives to challenge level)
-    op.add_column('challenges', sa.Column('points', sa.Integer(), nullable=False, server_default='10'))
-
-    # Add category and due_date for UI
-    op.add_column('challenges', sa.Column('category', sa.String(), nullable=True))
-    op.add_column('challenges', sa.Column('due_date', sa.DateTime(), nullable=True))
+    # Add all new columns, foreign keys inline, in a single ALTER TABLE so the
+    # table is locked once:
+    # - goal_id: challenges belong to goals
+    # - next_challenge_id: chaining
+    # - sort_order: ordering within a goal
+    # - visible_to_students: visibility flag
+    # - points: moved from objectives to challenge level
+    # - category, due_date: UI metadata
+    # The NOT NULL columns use constant defaults, which PostgreSQL 11+ stores
+    # in the catalog without rewriting existing rows.
+    op.execute("""
+        ALTER TABLE challenges
+            ADD COLUMN goal_id INTEGER
+                CONSTRAINT fk_challenges_goal_id REFERENCES goals (id) ON DELETE SET NULL,
+            ADD COLUMN next_challenge_id INTEGER
+                CONSTRAINT fk_challenges_next_challenge_id REFERENCES challenges (id) ON DELETE SET NULL,
+            ADD COLUMN sort_order INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN visible_to_students BOOLEAN NOT NULL DEFAULT true,
+            ADD COLUMN points INTEGER NOT NULL DEFAULT 10,
+            ADD COLUMN category VARCHAR,
+            ADD COLUMN due_date TIMESTAMP WITHOUT TIME ZONE
+    """)
 
 
 def downgrade() -> None:
@@ -7,7 +7,6 @@ Create Date: 2025-01-17
 """
 from alembic import op
 import sqlalchemy as sa
-from datetime import datetime
 
 
 # revision identifiers, used by Alembic.
@@ -18,32 +17,32 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Add scheduling fields to challenges
-    op.add_column('challenges', sa.Column('start_date', sa.DateTime(), nullable=True))
-    op.add_column('challenges', sa.Column('expires_at', sa.DateTime(), nullable=True))
-    op.add_column('challenges', sa.Column('recurrence_days', sa.Integer(), nullable=True,
-                                          comment='Days until challenge reappears (null = no recurrence)'))
-    op.add_column('challenges', sa.Column('recurrence_limit', sa.Integer(), nullable=True,
-                                          comment='Max times to recur (null = infinite)'))
-    op.add_column('challenges', sa.Column('recurrence_count', sa.Integer(), nullable=False, server_default='0',
-                                          comment='Current recurrence count'))
-    op.add_column('challenges', sa.Column('original_challenge_id', sa.Integer(), nullable=True,
-                                          comment='ID of original challenge if this is a recurrence'))
-
-    # Add foreign key for original_challenge_id
-    op.create_foreign_key(
-        'fk_challenges_original_challenge',
-        'challenges', 'challenges',
-        ['original_challenge_id'], ['id'],
-        ondelete='SET NULL'
-    )
+    # Add scheduling fields to challenges (one ALTER TABLE per table).
+    # recurrence_count's constant default doesn't rewrite rows on PostgreSQL 11+.
+    op.execute("""
+        ALTER TABLE challenges
+            ADD COLUMN start_date TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN expires_at TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN recurrence_days INTEGER,
+            ADD COLUMN recurrence_limit INTEGER,
+            ADD COLUMN recurrence_count INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN original_challenge_id INTEGER
+                CONSTRAINT fk_challenges_original_challenge REFERENCES challenges (id) ON DELETE SET NULL
+    """)
+    op.execute("COMMENT ON COLUMN challenges.recurrence_days IS 'Days until challenge reappears (null = no recurrence)'")
+    op.execute("COMMENT ON COLUMN challenges.recurrence_limit IS 'Max times to recur (null = infinite)'")
+    op.execute("COMMENT ON COLUMN challenges.recurrence_count IS 'Current recurrence count'")
+    op.execute("COMMENT ON COLUMN challenges.original_challenge_id IS 'ID of original challenge if this is a recurrence'")
 
     # Add scheduling fields to goals
-    op.add_column('goals', sa.Column('start_date', sa.DateTime(), nullable=True))
-    op.add_column('goals', sa.Column('expires_at', sa.DateTime(), nullable=True))
-    op.add_column('goals', sa.Column('recurrence_days', sa.Integer(), nullable=True))
-    op.add_column('goals', sa.Column('recurrence_limit', sa.Integer(), nullable=True))
-    op.add_column('goals', sa.Column('recurrence_count', sa.Integer(), nullable=False, server_default='0'))
+    op.execute("""
+        ALTER TABLE goals
+            ADD COLUMN start_date TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN expires_at TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN recurrence_days INTEGER,
+            ADD COLUMN recurrence_limit INTEGER,
+            ADD COLUMN recurrence_count INTEGER NOT NULL DEFAULT 0
+    """)
 
 
 def downgrade() -> None:
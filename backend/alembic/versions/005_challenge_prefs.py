@@ -20,7 +20,7 @@ def upgrade() -> None:
     # Create user_challenge_preferences table
     op.create_table(
         'user_challenge_preferences',
-        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('id', sa.Integer(), primary_key=True),
         sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), unique=True, nullable=False),
         sa.Column('second_slot_enabled', sa.Boolean(), nullable=False, server_default='false'),
         sa.Column('second_slot_challenge_id', sa.Integer(), sa.ForeignKey('challenges.id', ondelete='SET NULL'), nullable=True),
@@ -31,25 +31,18 @@ def upgrade() -> None:
     # Create snoozed_challenges table
     op.create_table(
         'snoozed_challenges',
-        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('id', sa.Integer(), primary_key=True),
         sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
         sa.Column('challenge_id', sa.Integer(), sa.ForeignKey('challenges.id', ondelete='CASCADE'), nullable=False),
         sa.Column('snoozed_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
         sa.Column('snoozed_until', sa.DateTime(), nullable=False, comment='When challenge becomes available again'),
         sa.Column('reason', sa.String(), nullable=True, comment='Optional reason for snoozing'),
-    )
-
-    # Add unique constraint for user_id + challenge_id in snoozed_challenges
-    op.create_unique_constraint(
-        'uq_user_snoozed_challenge',
-        'snoozed_challenges',
-        ['user_id', 'challenge_id']
+        sa.UniqueConstraint('user_id', 'challenge_id', name='uq_user_snoozed_challenge'),
     )
 
 
 def downgrade() -> None:
     # Drop snoozed_challenges table
-    op.drop_constraint('uq_user_snoozed_challenge', 'snoozed_challenges', type_='unique')
     op.drop_table('snoozed_challenges')
 
     # Drop user_challenge_preferences table
@@ -7,6 +7,7 @@ Create Date: 2025-01-17
 """
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -15,49 +16,60 @@ down_revision = '005_challenge_prefs'
 branch_labels = None
 depends_on = None
 
+notification_type = postgresql.ENUM('deadline', 'nudge', 'streak', name='notificationtype', create_type=False)
+
+# (index name, column, partial index predicate)
+# Most notifications carry no dedup_key, so that index only covers keyed rows.
+# Pending-notification lookups are served by ix_notifications_user_pending (011).
+INDEXES = [
+    ('ix_notifications_user_id', 'user_id', None),
+    ('ix_notifications_scheduled_for', 'scheduled_for', None),
+    ('ix_notifications_dedup_key', 'dedup_key', 'dedup_key IS NOT NULL'),
+]
+
 
 def upgrade() -> None:
     conn = op.get_bind()
 
-    # Check if enum exists, create if not
-    enum_exists = conn.execute(sa.text(
-        "SELECT 1 FROM pg_type WHERE typname = 'notificationtype'"
-    )).fetchone()
-
-    if not enum_exists:
-        conn.execute(sa.text(
-            "CREATE TYPE notificationtype AS ENUM ('deadline', 'nudge', 'streak')"
-        ))
+    # Create enum if it doesn't exist yet
+    notification_type.create(conn, checkfirst=True)
 
     # Check if table exists, create if not
-    table_exists = conn.execute(sa.text(
-        "SELECT 1 FROM information_schema.tables WHERE table_name = 'notifications'"
-    )).fetchone()
+    # to_regclass resolves through search_path, the same place CREATE TABLE targets
+    table_exists = conn.execute(sa.text("SELECT to_regclass('notifications')")).scalar() is not None
 
     if not table_exists:
-        # Create table using raw SQL to completely bypass SQLAlchemy's event system
-        conn.execute(sa.text("""
-            CREATE TABLE notifications (
-                id SERIAL PRIMARY KEY,
-                user_id INTEGER NOT NULL REFERENCES users(id) ON DELETE CASCADE,
-                type notificationtype NOT NULL,
-                title VARCHAR NOT NULL,
-                body TEXT NOT NULL,
-                related_goal_id INTEGER REFERENCES goals(id) ON DELETE CASCADE,
-                related_challenge_id INTEGER REFERENCES challenges(id) ON DELETE CASCADE,
-                scheduled_for TIMESTAMP NOT NULL,
-                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                read_at TIMESTAMP,
-                dismissed_at TIMESTAMP,
-                dedup_key VARCHAR
-            )
-        """))
+        # notification_type has create_type=False, so create_table won't emit CREATE TYPE again
+        op.create_table(
+            'notifications',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=False),
+            sa.Column('type', notification_type, nullable=False),
+            sa.Column('title', sa.String(), nullable=False),
+            sa.Column('body', sa.Text(), nullable=False),
+            sa.Column('related_goal_id', sa.Integer(), nullable=True),
+            sa.Column('related_challenge_id', sa.Integer(), nullable=True),
+            sa.Column('scheduled_for', sa.DateTime(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+            sa.Column('read_at', sa.DateTime(), nullable=True),
+            sa.Column('dismissed_at', sa.DateTime(), nullable=True),
+            sa.Column('dedup_key', sa.String(), nullable=True),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['related_goal_id'], ['goals.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['related_challenge_id'], ['challenges.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+        )
 
-        # Create indexes separately
-        conn.execute(sa.text("CREATE INDEX ix_notifications_id ON notifications(id)"))
-        conn.execute(sa.text("CREATE INDEX ix_notifications_user_id ON notifications(user_id)"))
-        conn.execute(sa.text("CREATE INDEX ix_notifications_scheduled_for ON notifications(scheduled_for)"))
-        conn.execute(sa.text("CREATE INDEX ix_notifications_dedup_key ON notifications(dedup_key)"))
+    # Outside the guard so a pre-existing table still gets its indexes; building
+    # them concurrently keeps that case from blocking writes to the table.
+    with op.get_context().autocommit_block():
+        for name, column, where in INDEXES:
+            op.create_index(
+                name, 'notifications', [column],
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
 
 
 def downgrade() -> None:
@@ -65,5 +77,4 @@ def downgrade() -> None:
     op.drop_table('notifications')
 
     # Drop notification type enum
-    notification_type = sa.Enum('deadline', 'nudge', 'streak', name='notificationtype')
-    notification_type.drop(op.get_bind())
+    notification_type.drop(op.get_bind(), checkfirst=True)
@@ -20,9 +20,8 @@ def upgrade() -> None:
     conn = op.get_bind()
 
     # Check if table exists, create if not
-    table_exists = conn.execute(sa.text(
-        "SELECT 1 FROM information_schema.tables WHERE table_name = 'snoozed_goal_tasks'"
-    )).fetchone()
+    # to_regclass resolves through search_path, the same place CREATE TABLE targets
+    table_exists = conn.execute(sa.text("SELECT to_regclass('snoozed_goal_tasks')")).scalar() is not None
 
     if not table_exists:
         # Create table using raw SQL
@@ -37,9 +36,10 @@ def upgrade() -> None:
             )
         """))
 
-        # Create indexes
-        conn.execute(sa.text("CREATE INDEX ix_snoozed_goal_tasks_id ON snoozed_goal_tasks(id)"))
-        conn.execute(sa.text("CREATE INDEX ix_snoozed_goal_tasks_user_id ON snoozed_goal_tasks(user_id)"))
+    # Outside the guard so a pre-existing table still gets its indexes
+    with op.get_context().autocommit_block():
+        op.create_index('ix_snoozed_goal_tasks_user_id', 'snoozed_goal_tasks', ['user_id'],
+                        postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
@@ -0,0 +1,40 @@
+"""Index foreign key columns on challenge tables
+
+Revision ID: 008_challenge_fk_indexes
+Revises: 007_snoozed_tasks
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '008_challenge_fk_indexes'
+down_revision = '007_snoozed_tasks'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+# user_challenge_progress.user_id, user_objective_progress.user_id and
+# challenge_links.from_challenge_id are already the leading column of their
+# unique constraints, so only the other side of each FK needs an index.
+INDEXES = [
+    ('ix_objectives_challenge_id', 'objectives', ['challenge_id']),
+    ('ix_challenge_links_to_challenge_id', 'challenge_links', ['to_challenge_id']),
+    ('ix_user_challenge_progress_challenge_id', 'user_challenge_progress', ['challenge_id']),
+    ('ix_user_objective_progress_objective_id', 'user_objective_progress', ['objective_id']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
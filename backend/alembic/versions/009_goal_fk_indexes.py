@@ -0,0 +1,40 @@
+"""Index foreign key columns on goal tables
+
+Revision ID: 009_goal_fk_indexes
+Revises: 008_challenge_fk_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '009_goal_fk_indexes'
+down_revision = '008_challenge_fk_indexes'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+# The user_id side of user_goal_progress / user_goal_step_progress and
+# goal_links.from_goal_id are the leading columns of uq_user_goal,
+# uq_user_goal_step and uq_goal_link_condition, which already index them.
+INDEXES = [
+    ('ix_goal_steps_goal_id', 'goal_steps', ['goal_id']),
+    ('ix_goal_links_to_goal_id', 'goal_links', ['to_goal_id']),
+    ('ix_user_goal_progress_goal_id', 'user_goal_progress', ['goal_id']),
+    ('ix_user_goal_step_progress_step_id', 'user_goal_step_progress', ['step_id']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
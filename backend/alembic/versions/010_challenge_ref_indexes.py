@@ -0,0 +1,43 @@
+"""Index goal and chaining references on challenges
+
+Revision ID: 010_challenge_ref_indexes
+Revises: 009_goal_fk_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_challenge_ref_indexes'
+down_revision = '009_goal_fk_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Most challenges have no goal/next/original challenge, so the indexes are
+# partial over the non-null rows. They still serve the ON DELETE SET NULL
+# lookups, which only ever match non-null values.
+INDEXES = [
+    ('ix_challenges_goal_id', 'goal_id'),
+    ('ix_challenges_next_challenge_id', 'next_challenge_id'),
+    ('ix_challenges_original_challenge_id', 'original_challenge_id'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name, 'challenges', [column],
+                postgresql_where=sa.text(f'{column} IS NOT NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='challenges', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,40 @@
+"""Partial index for pending notifications
+
+Revision ID: 011_notifications_pending
+Revises: 010_challenge_ref_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011_notifications_pending'
+down_revision = '010_challenge_ref_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Matches the "unread, not dismissed, due for user X" queries in
+    # NotificationService; read/dismissed history stays out of the index.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_pending',
+            'notifications',
+            ['user_id', 'scheduled_for'],
+            postgresql_where=sa.text('read_at IS NULL AND dismissed_at IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_notifications_user_pending',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
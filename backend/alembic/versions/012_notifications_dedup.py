@@ -0,0 +1,86 @@
+"""Enforce notification dedup keys per user
+
+Revision ID: 012_notifications_dedup
+Revises: 011_notifications_pending
+Create Date: 2026-10-15
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012_notifications_dedup'
+down_revision = '011_notifications_pending'
+branch_labels = None
+depends_on = None
+
+
+def _drop_index_if_invalid(name: str) -> None:
+    """
+    Drop an index left INVALID by a failed CREATE INDEX CONCURRENTLY, so that the
+    IF NOT EXISTS create that follows builds it again instead of skipping it.
+    Must run inside an autocommit block. Offline (--sql) runs have no database to
+    inspect and skip the check.
+    """
+    if context.is_offline_mode():
+        return
+    invalid = op.get_bind().execute(
+        sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.drop_index(name, table_name='notifications', postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    # Keep the oldest row for any (user_id, dedup_key) pair and clear the key
+    # on later copies so the unique index can be built.
+    op.execute(sa.text("""
+        UPDATE notifications n
+        SET dedup_key = NULL
+        WHERE n.dedup_key IS NOT NULL
+          AND EXISTS (
+              SELECT 1 FROM notifications o
+              WHERE o.user_id = n.user_id
+                AND o.dedup_key = n.dedup_key
+                AND o.id < n.id
+          )
+    """))
+
+    with op.get_context().autocommit_block():
+        # ON CONFLICT ignores an invalid index, so a rerun must not keep one
+        _drop_index_if_invalid('uq_notifications_user_dedup_key')
+        op.create_index(
+            'uq_notifications_user_dedup_key',
+            'notifications',
+            ['user_id', 'dedup_key'],
+            unique=True,
+            postgresql_where=sa.text('dedup_key IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_notifications_dedup_key',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_dedup_key',
+            'notifications',
+            ['dedup_key'],
+            postgresql_where=sa.text('dedup_key IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'uq_notifications_user_dedup_key',
+            table_name='notifications',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,38 @@
+"""Index active snoozes per user
+
+Revision ID: 013_snoozed_active_idx
+Revises: 012_notifications_dedup
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '013_snoozed_active_idx'
+down_revision = '012_notifications_dedup'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "WHERE user_id = ? AND snoozed_until > now()". A partial index on
+    # now() isn't possible (not immutable), so this is a plain composite.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_snoozed_challenges_user_active',
+            'snoozed_challenges',
+            ['user_id', 'snoozed_until'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_snoozed_challenges_user_active',
+            table_name='snoozed_challenges',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,44 @@
+"""Composite index for listing a goal's challenges in order
+
+Revision ID: 014_challenges_goal_listing
+Revises: 013_snoozed_active_idx
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014_challenges_goal_listing'
+down_revision = '013_snoozed_active_idx'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "WHERE goal_id = ? ORDER BY sort_order, id" without a sort step.
+    # goal_id leads, so it also covers what ix_challenges_goal_id was for.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_challenges_goal_listing',
+            'challenges',
+            ['goal_id', 'sort_order', 'id'],
+            postgresql_where=sa.text('goal_id IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_challenges_goal_id', table_name='challenges', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_challenges_goal_id',
+            'challenges',
+            ['goal_id'],
+            postgresql_where=sa.text('goal_id IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_challenges_goal_listing', table_name='challenges', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,46 @@
+"""Drop indexes that duplicate primary keys
+
+Revision ID: 015_drop_pk_dup_indexes
+Revises: 014_challenges_goal_listing
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015_drop_pk_dup_indexes'
+down_revision = '014_challenges_goal_listing'
+branch_labels = None
+depends_on = None
+
+
+# Each of these tables already has a unique btree on id from its primary key
+TABLES = [
+    'users',
+    'profiles',
+    'challenges',
+    'objectives',
+    'challenge_links',
+    'user_challenge_progress',
+    'user_objective_progress',
+    'goals',
+    'goal_steps',
+    'goal_links',
+    'user_goal_progress',
+    'user_goal_step_progress',
+    'user_challenge_preferences',
+    'snoozed_challenges',
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(f'ix_{table}_id', table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.create_index(f'ix_{table}_id', table, ['id'], postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,41 @@
+"""Index notification links to goals and challenges
+
+Revision ID: 016_notifications_related_idx
+Revises: 015_drop_pk_dup_indexes
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '016_notifications_related_idx'
+down_revision = '015_drop_pk_dup_indexes'
+branch_labels = None
+depends_on = None
+
+
+# Both are ON DELETE CASCADE and most notifications reference at most one of
+# them, so the indexes are partial over the non-null rows.
+INDEXES = [
+    ('ix_notifications_related_challenge_id', 'related_challenge_id'),
+    ('ix_notifications_related_goal_id', 'related_goal_id'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name, 'notifications', [column],
+                postgresql_where=sa.text(f'{column} IS NOT NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='notifications', postgresql_concurrently=True, if_exists=True)
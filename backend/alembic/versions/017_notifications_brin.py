@@ -0,0 +1,48 @@
+"""Use BRIN indexes for notification timestamps
+
+Revision ID: 017_notifications_brin
+Revises: 016_notifications_related_idx
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '017_notifications_brin'
+down_revision = '016_notifications_related_idx'
+branch_labels = None
+depends_on = None
+
+
+# Notifications are appended with scheduled_for/created_at close to now(), so
+# both columns follow the physical row order and BRIN ranges stay tight.
+# Per-user lookups go through ix_notifications_user_pending instead.
+INDEXES = [
+    ('ix_notifications_scheduled_for_brin', 'scheduled_for'),
+    ('ix_notifications_created_at_brin', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in INDEXES:
+            op.create_index(
+                name, 'notifications', [column],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 64},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index('ix_notifications_scheduled_for', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_scheduled_for', 'notifications', ['scheduled_for'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='notifications', postgresql_concurrently=True, if_exists=True)
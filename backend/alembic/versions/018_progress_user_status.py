@@ -0,0 +1,37 @@
+"""Index progress tables on (user_id, status)
+
+Revision ID: 018_progress_user_status
+Revises: 017_notifications_brin
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '018_progress_user_status'
+down_revision = '017_notifications_brin'
+branch_labels = None
+depends_on = None
+
+
+# (index name, table, columns)
+# Progress is usually read as "this user's rows in this state" (activity
+# summaries, active challenge lookup), which the (user_id, <fk>) unique
+# constraints can only answer by filtering every row of the user.
+INDEXES = [
+    ('ix_user_challenge_progress_user_status', 'user_challenge_progress', ['user_id', 'status']),
+    ('ix_user_objective_progress_user_status', 'user_objective_progress', ['user_id', 'status']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
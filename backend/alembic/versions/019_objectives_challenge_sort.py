@@ -0,0 +1,41 @@
+"""Composite index for listing a challenge's objectives in order
+
+Revision ID: 019_objectives_challenge_sort
+Revises: 018_progress_user_status
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '019_objectives_challenge_sort'
+down_revision = '018_progress_user_status'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "WHERE challenge_id = ? ORDER BY sort_order" without a sort step.
+    # challenge_id leads, so it also covers what ix_objectives_challenge_id was for.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_objectives_challenge_sort',
+            'objectives',
+            ['challenge_id', 'sort_order'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_objectives_challenge_id', table_name='objectives', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_objectives_challenge_id',
+            'objectives',
+            ['challenge_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('ix_objectives_challenge_sort', table_name='objectives', postgresql_concurrently=True, if_exists=True)
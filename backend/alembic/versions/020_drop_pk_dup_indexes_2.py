@@ -0,0 +1,34 @@
+"""Drop remaining indexes that duplicate primary keys
+
+Revision ID: 020_drop_pk_dup_indexes_2
+Revises: 019_objectives_challenge_sort
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '020_drop_pk_dup_indexes_2'
+down_revision = '019_objectives_challenge_sort'
+branch_labels = None
+depends_on = None
+
+
+# Tables created by 006/007 that 015 left alone
+TABLES = [
+    'notifications',
+    'snoozed_goal_tasks',
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.drop_index(f'ix_{table}_id', table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.create_index(f'ix_{table}_id', table, ['id'], postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,35 @@
+"""Partial index for picking the next active challenge in order
+
+Revision ID: 021_challenges_active_sort
+Revises: 020_drop_pk_dup_indexes_2
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '021_challenges_active_sort'
+down_revision = '020_drop_pk_dup_indexes_2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves "WHERE is_active ORDER BY sort_order, id LIMIT 1": the scan walks
+    # active challenges in order and stops at the first one the user hasn't completed.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_challenges_active_sort',
+            'challenges',
+            ['sort_order', 'id'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_challenges_active_sort', table_name='challenges', postgresql_concurrently=True, if_exists=True)
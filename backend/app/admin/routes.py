@@ -1,23 +1,27 @@
 """
 Admin Routes
 """
+import os
 import secrets
 import string
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.common.dependencies import get_db, require_admin
 from app.auth.models import User
 from app.auth.utils import get_password_hash, get_current_active_user
 from app.users.models import Profile
+from app.challenges.cache import active_challenge_cache
 from app.challenges.models import (
     Challenge,
     Objective,
     ChallengeLink,
     UserChallengeProgress,
     UserObjectiveProgress,
+    ChallengeStatus,
     ObjectiveStatus,
 )
 from app.challenges.schemas import (
@@ -34,43 +38,61 @@ from app.challenges.schemas import (
 from app.admin.schemas import (
     UserListResponse,
     UserActivityResponse,
+    UserActivitySummary,
     ChallengeProgressDetail,
     PasswordResetResponse,
 )
 
 router = APIRouter()
 
+_PASSWORD_ALPHABET = string.ascii_letters + string.digits + string.punctuation
+# Bytes at or above this are rejected so that b % len(alphabet) stays unbiased
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_PASSWORD_ALPHABET)
+_sysrandom = secrets.SystemRandom()
+
+
+def _random_password_chars(count: int) -> list[str]:
+    """Draw count characters from the password alphabet using batched os.urandom reads"""
+    chars: list[str] = []
+    while len(chars) < count:
+        chars.extend(
+            _PASSWORD_ALPHABET[b % len(_PASSWORD_ALPHABET)]
+            for b in os.urandom(count)
+            if b < _PASSWORD_BYTE_LIMIT
+        )
+    return chars[:count]
+
 
 def generate_temp_password(length: int = 12) -> str:
     """Generate a secure temporary password"""
-    alphabet = string.ascii_letters + string.digits + string.punctuation
     # Ensure at least one of each type
     password = [
-        secrets.choice(string.ascii_lowercase),
-        secrets.choice(string.ascii_uppercase),
-        secrets.choice(string.digits),
-        secrets.choice(string.punctuation),
+        _sysrandom.choice(string.ascii_lowercase),
+        _sysrandom.choice(string.ascii_uppercase),
+        _sysrandom.choice(string.digits),
+        _sysrandom.choice(string.punctuation),
     ]
     # Fill the rest randomly
-    password += [secrets.choice(alphabet) for _ in range(length - 4)]
+    password += _random_password_chars(length - 4)
     # Shuffle
-    secrets.SystemRandom().shuffle(password)
+    _sysrandom.shuffle(password)
     return "".join(password)
 
 
 # Challenge Management
 @router.get("/challenges", response_model=list[ChallengeResponse])
-async def list_challenges(
+def list_challenges(
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """List all challenges (admin only)"""
-    challenges = db.query(Challenge).order_by(Challenge.id).all()
+    # Plain rows are enough for ChallengeResponse; skip ORM identity-map hydration
+    challenges = db.query(*Challenge.__table__.columns).order_by(Challenge.id).all()
     return challenges
 
 
 @router.post("/challenges", response_model=ChallengeResponse, status_code=status.HTTP_201_CREATED)
-async def create_challenge(
+def create_challenge(
     challenge_data: ChallengeCreate,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -98,7 +120,7 @@ async def create_challenge(
 
 
 @router.put("/challenges/{challenge_id}", response_model=ChallengeResponse)
-async def update_challenge(
+def update_challenge(
     challenge_id: int,
     challenge_data: ChallengeUpdate,
     current_admin: User = Depends(require_admin),
@@ -118,13 +140,14 @@ async def update_challenge(
         setattr(challenge, field, value)
 
     db.commit()
+    active_challenge_cache.clear()
     db.refresh(challenge)
 
     return challenge
 
 
 @router.get("/challenges/{challenge_id}", response_model=ChallengeWithObjectives)
-async def get_challenge(
+def get_challenge(
     challenge_id: int,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -156,7 +179,7 @@ async def get_challenge(
 
 
 @router.delete("/challenges/{challenge_id}")
-async def delete_challenge(
+def delete_challenge(
     challenge_id: int,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -176,13 +199,14 @@ async def delete_challenge(
     # And objectives will cascade delete user_objective_progress
     db.delete(challenge)
     db.commit()
+    active_challenge_cache.clear()
 
     return {"ok": True, "message": f"Challenge '{challenge.title}' deleted successfully"}
 
 
 # Objective Management
 @router.post("/challenges/{challenge_id}/objectives", response_model=ObjectiveResponse, status_code=status.HTTP_201_CREATED)
-async def create_objective(
+def create_objective(
     challenge_id: int,
     objective_data: ObjectiveCreate,
     current_admin: User = Depends(require_admin),
@@ -208,13 +232,14 @@ async def create_objective(
 
     db.add(objective)
     db.commit()
+    active_challenge_cache.clear()
     db.refresh(objective)
 
     return objective
 
 
 @router.put("/objectives/{objective_id}", response_model=ObjectiveResponse)
-async def update_objective(
+def update_objective(
     objective_id: int,
     objective_data: ObjectiveUpdate,
     current_admin: User = Depends(require_admin),
@@ -234,6 +259,7 @@ async def update_objective(
         setattr(objective, field, value)
 
     db.commit()
+    active_challenge_cache.clear()
     db.refresh(objective)
 
     return objective
@@ -241,7 +267,7 @@ async def update_objective(
 
 # Challenge Linking
 @router.post("/challenges/{challenge_id}/link-next", response_model=ChallengeLinkResponse)
-async def link_next_challenge(
+def link_next_challenge(
     challenge_id: int,
     link_data: ChallengeLinkCreate,
     current_admin: User = Depends(require_admin),
@@ -249,79 +275,69 @@ async def link_next_challenge(
 ):
     """Link a next challenge (upsert) (admin only)"""
     # Verify both challenges exist
-    from_challenge = db.query(Challenge).filter(Challenge.id == challenge_id).first()
-    if not from_challenge:
+    found_ids = {
+        row.id
+        for row in db.query(Challenge.id)
+        .filter(Challenge.id.in_([challenge_id, link_data.to_challenge_id]))
+        .all()
+    }
+    if challenge_id not in found_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Source challenge not found",
         )
-
-    to_challenge = db.query(Challenge).filter(Challenge.id == link_data.to_challenge_id).first()
-    if not to_challenge:
+    if link_data.to_challenge_id not in found_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Target challenge not found",
         )
 
-    # Check if link already exists
-    existing_link = (
-        db.query(ChallengeLink)
-        .filter(
-            ChallengeLink.from_challenge_id == challenge_id,
-            ChallengeLink.condition == link_data.condition,
-        )
-        .first()
-    )
-
-    if existing_link:
-        # Update existing link
-        existing_link.to_challenge_id = link_data.to_challenge_id
-        db.commit()
-        db.refresh(existing_link)
-        return existing_link
-    else:
-        # Create new link
-        new_link = ChallengeLink(
+    # Insert or repoint the link in one statement (uq_challenge_link_condition)
+    stmt = (
+        pg_insert(ChallengeLink)
+        .values(
             from_challenge_id=challenge_id,
             to_challenge_id=link_data.to_challenge_id,
             condition=link_data.condition,
         )
-        db.add(new_link)
-        db.commit()
-        db.refresh(new_link)
-        return new_link
+        .on_conflict_do_update(
+            index_elements=[ChallengeLink.from_challenge_id, ChallengeLink.condition],
+            set_={"to_challenge_id": link_data.to_challenge_id},
+        )
+        .returning(ChallengeLink)
+    )
+    link = db.scalars(stmt).one()
+    response = ChallengeLinkResponse.model_validate(link)
+    db.commit()
+
+    return response
 
 
 # User Management
 @router.get("/users", response_model=list[UserListResponse])
-async def list_users(
+def list_users(
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """List all users (admin only)"""
-    users = db.query(User).all()
-
-    result = []
-    for user in users:
-        profile = db.query(Profile).filter(Profile.user_id == user.id).first()
-        role = profile.role.value if profile and profile.role else None
-
-        result.append(
-            UserListResponse(
-                id=user.id,
-                email=user.email,
-                created_at=user.created_at,
-                is_admin=user.is_admin,
-                is_active=user.is_active,
-                role=role,
-            )
+    rows = (
+        db.query(
+            User.id,
+            User.email,
+            User.created_at,
+            User.is_admin,
+            User.is_active,
+            Profile.role.label("role"),
         )
+        .outerjoin(Profile, Profile.user_id == User.id)
+        .all()
+    )
 
-    return result
+    return [UserListResponse.model_validate(row) for row in rows]
 
 
-@router.get("/users/{user_id}/activity", response_model=dict)
-async def get_user_activity(
+@router.get("/users/{user_id}/activity", response_model=UserActivityResponse)
+def get_user_activity(
     user_id: int,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -334,85 +350,74 @@ async def get_user_activity(
             detail="User not found",
         )
 
-    # Get challenge progress
-    challenge_progress = (
-        db.query(UserChallengeProgress)
+    # Challenge counts in a single pass over the user's progress rows
+    challenges_completed, challenges_in_progress = (
+        db.query(
+            func.count().filter(UserChallengeProgress.status == ChallengeStatus.COMPLETE),
+            func.count().filter(UserChallengeProgress.status == ChallengeStatus.IN_PROGRESS),
+        )
         .filter(UserChallengeProgress.user_id == user_id)
-        .all()
+        .one()
     )
 
-    challenges_completed = sum(1 for cp in challenge_progress if cp.status.value == "COMPLETE")
-    challenges_in_progress = sum(1 for cp in challenge_progress if cp.status.value == "IN_PROGRESS")
-
-    # Get objective progress
-    objectives_completed = (
-        db.query(UserObjectiveProgress)
+    # Completed objectives and their points together
+    objectives_completed, total_points = (
+        db.query(
+            func.count(UserObjectiveProgress.id),
+            func.coalesce(func.sum(Objective.points), 0),
+        )
+        .join(Objective, UserObjectiveProgress.objective_id == Objective.id)
         .filter(
             UserObjectiveProgress.user_id == user_id,
             UserObjectiveProgress.status == ObjectiveStatus.COMPLETE,
         )
-        .count()
+        .one()
     )
 
-    # Calculate total points
-    completed_objective_ids = (
-        db.query(UserObjectiveProgress.objective_id)
-        .filter(
-            UserObjectiveProgress.user_id == user_id,
-            UserObjectiveProgress.status == ObjectiveStatus.COMPLETE,
+    # Get detailed challenge progress with objective counts in one grouped query
+    detail_rows = (
+        db.query(
+            UserChallengeProgress.challenge_id,
+            Challenge.title.label("challenge_title"),
+            UserChallengeProgress.status,
+            UserChallengeProgress.started_at,
+            UserChallengeProgress.completed_at,
+            func.count(UserObjectiveProgress.id).label("objectives_completed"),
+            func.count(Objective.id).label("objectives_total"),
         )
+        .join(Challenge, Challenge.id == UserChallengeProgress.challenge_id)
+        .outerjoin(Objective, Objective.challenge_id == Challenge.id)
+        .outerjoin(
+            UserObjectiveProgress,
+            and_(
+                UserObjectiveProgress.objective_id == Objective.id,
+                UserObjectiveProgress.user_id == user_id,
+                UserObjectiveProgress.status == ObjectiveStatus.COMPLETE,
+            ),
+        )
+        .filter(UserChallengeProgress.user_id == user_id)
+        .group_by(UserChallengeProgress.id, Challenge.id)
+        .order_by(UserChallengeProgress.id)
         .all()
     )
-    completed_ids = [obj_id[0] for obj_id in completed_objective_ids]
-
-    total_points = 0
-    if completed_ids:
-        total_points = db.query(func.sum(Objective.points)).filter(Objective.id.in_(completed_ids)).scalar() or 0
-
-    # Get detailed challenge progress
-    challenge_details = []
-    for cp in challenge_progress:
-        challenge = db.query(Challenge).filter(Challenge.id == cp.challenge_id).first()
-        if challenge:
-            total_objectives = db.query(Objective).filter(Objective.challenge_id == challenge.id).count()
-            completed_objectives = (
-                db.query(UserObjectiveProgress)
-                .join(Objective, UserObjectiveProgress.objective_id == Objective.id)
-                .filter(
-                    UserObjectiveProgress.user_id == user_id,
-                    Objective.challenge_id == challenge.id,
-                    UserObjectiveProgress.status == ObjectiveStatus.COMPLETE,
-                )
-                .count()
-            )
-
-            challenge_details.append(
-                ChallengeProgressDetail(
-                    challenge_id=challenge.id,
-                    challenge_title=challenge.title,
-                    status=cp.status,
-                    started_at=cp.started_at,
-                    completed_at=cp.completed_at,
-                    objectives_completed=completed_objectives,
-                    objectives_total=total_objectives,
-                )
-            )
-
-    return {
-        "user_id": user.id,
-        "email": user.email,
-        "summary": {
-            "challenges_completed": challenges_completed,
-            "challenges_in_progress": challenges_in_progress,
-            "objectives_completed": objectives_completed,
-            "total_points": total_points,
-        },
-        "challenge_progress": challenge_details,
-    }
+
+    challenge_details = [ChallengeProgressDetail.model_validate(row) for row in detail_rows]
+
+    return UserActivityResponse(
+        user_id=user.id,
+        email=user.email,
+        summary=UserActivitySummary(
+            challenges_completed=challenges_completed,
+            challenges_in_progress=challenges_in_progress,
+            objectives_completed=objectives_completed,
+            total_points=total_points,
+        ),
+        challenge_progress=challenge_details,
+    )
 
 
 @router.post("/users/{user_id}/reset-password", response_model=PasswordResetResponse)
-async def reset_user_password(
+def reset_user_password(
     user_id: int,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -2,7 +2,7 @@
 Admin Pydantic Schemas
 """
 from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional
 
 from app.challenges.models import ChallengeStatus
@@ -18,16 +18,7 @@ class UserListResponse(BaseModel):
     is_active: bool
     role: Optional[str] = None
 
-
-class UserActivityResponse(BaseModel):
-    """Schema for user activity response"""
-
-    user_id: int
-    email: EmailStr
-    challenges_completed: int
-    challenges_in_progress: int
-    objectives_completed: int
-    total_points: int
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ChallengeProgressDetail(BaseModel):
@@ -41,6 +32,26 @@ class ChallengeProgressDetail(BaseModel):
     objectives_completed: int
     objectives_total: int
 
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UserActivitySummary(BaseModel):
+    """Schema for user activity summary counts"""
+
+    challenges_completed: int
+    challenges_in_progress: int
+    objectives_completed: int
+    total_points: int
+
+
+class UserActivityResponse(BaseModel):
+    """Schema for user activity response"""
+
+    user_id: int
+    email: EmailStr
+    summary: UserActivitySummary
+    challenge_progress: list[ChallengeProgressDetail]
+
 
 class PasswordResetResponse(BaseModel):
     """Schema for password reset response"""
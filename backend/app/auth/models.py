@@ -14,14 +14,15 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     email = Column(String, unique=True, index=True, nullable=False)
     password_hash = Column(String, nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     is_admin = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
-    # Relationship to profile
+    # Relationship to profile. Left lazy: every authenticated request loads a User,
+    # so batch readers should opt in with selectinload(User.profile) or a join.
     profile = relationship("Profile", back_populates="user", uselist=False)
 
     def __repr__(self):
@@ -0,0 +1,23 @@
+"""
+Per-user cache of the rendered active challenge response
+
+GET /me/active-challenge is polled by clients and does not change between
+writes, so the rendered response is kept for a short TTL, along with an ETag so
+unchanged polls can be answered with 304 Not Modified. Every route that changes
+a user's challenge progress calls invalidate(user_id) after committing; admin
+edits to challenges or objectives call clear().
+"""
+import hashlib
+
+from app.challenges.schemas import ActiveChallengeResponse
+from app.common.cache import TTLCache
+
+ACTIVE_CHALLENGE_TTL_SECONDS = 30
+
+# user_id -> (ActiveChallengeResponse, etag)
+active_challenge_cache = TTLCache(ttl_seconds=ACTIVE_CHALLENGE_TTL_SECONDS, maxsize=10000)
+
+
+def compute_etag(response: ActiveChallengeResponse) -> str:
+    """Strong ETag over the serialized response"""
+    return '"%s"' % hashlib.sha1(response.model_dump_json().encode()).hexdigest()
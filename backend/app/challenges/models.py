@@ -9,9 +9,11 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     String,
+    Index,
     Text,
     UniqueConstraint,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -39,7 +41,7 @@ class Challenge(Base):
 
     __tablename__ = "challenges"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
@@ -80,6 +82,23 @@ class Challenge(Base):
     )
     user_progress = relationship("UserChallengeProgress", back_populates="challenge", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index(
+            "ix_challenges_goal_listing",
+            "goal_id",
+            "sort_order",
+            "id",
+            postgresql_where=text("goal_id IS NOT NULL"),
+        ),
+        Index("ix_challenges_active_sort", "sort_order", "id", postgresql_where=text("is_active")),
+        Index("ix_challenges_next_challenge_id", "next_challenge_id", postgresql_where=text("next_challenge_id IS NOT NULL")),
+        Index(
+            "ix_challenges_original_challenge_id",
+            "original_challenge_id",
+            postgresql_where=text("original_challenge_id IS NOT NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Challenge(id={self.id}, title={self.title})>"
 
@@ -89,7 +108,7 @@ class Objective(Base):
 
     __tablename__ = "objectives"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
@@ -101,6 +120,8 @@ class Objective(Base):
     challenge = relationship("Challenge", back_populates="objectives")
     user_progress = relationship("UserObjectiveProgress", back_populates="objective", cascade="all, delete-orphan")
 
+    __table_args__ = (Index("ix_objectives_challenge_sort", "challenge_id", "sort_order"),)
+
     def __repr__(self):
         return f"<Objective(id={self.id}, title={self.title})>"
 
@@ -110,9 +131,9 @@ class ChallengeLink(Base):
 
     __tablename__ = "challenge_links"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     from_challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False)
-    to_challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False)
+    to_challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False, index=True)
     condition = Column(String, default="ON_COMPLETE", nullable=False)
 
     # Relationships
@@ -129,9 +150,9 @@ class UserChallengeProgress(Base):
 
     __tablename__ = "user_challenge_progress"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False)
+    challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(SQLEnum(ChallengeStatus), default=ChallengeStatus.NOT_STARTED, nullable=False)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
@@ -139,7 +160,10 @@ class UserChallengeProgress(Base):
     # Relationships
     challenge = relationship("Challenge", back_populates="user_progress")
 
-    __table_args__ = (UniqueConstraint("user_id", "challenge_id", name="uq_user_challenge"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "challenge_id", name="uq_user_challenge"),
+        Index("ix_user_challenge_progress_user_status", "user_id", "status"),
+    )
 
     def __repr__(self):
         return f"<UserChallengeProgress(user_id={self.user_id}, challenge_id={self.challenge_id}, status={self.status})>"
@@ -150,16 +174,19 @@ class UserObjectiveProgress(Base):
 
     __tablename__ = "user_objective_progress"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    objective_id = Column(Integer, ForeignKey("objectives.id", ondelete="CASCADE"), nullable=False)
+    objective_id = Column(Integer, ForeignKey("objectives.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(SQLEnum(ObjectiveStatus), default=ObjectiveStatus.INCOMPLETE, nullable=False)
     completed_at = Column(DateTime, nullable=True)
 
     # Relationships
     objective = relationship("Objective", back_populates="user_progress")
 
-    __table_args__ = (UniqueConstraint("user_id", "objective_id", name="uq_user_objective"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "objective_id", name="uq_user_objective"),
+        Index("ix_user_objective_progress_user_status", "user_id", "status"),
+    )
 
     def __repr__(self):
         return f"<UserObjectiveProgress(user_id={self.user_id}, objective_id={self.objective_id}, status={self.status})>"
@@ -170,7 +197,7 @@ class UserChallengePreferences(Base):
 
     __tablename__ = "user_challenge_preferences"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False)
     second_slot_enabled = Column(Boolean, default=False, nullable=False)
     second_slot_challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="SET NULL"), nullable=True)
@@ -186,14 +213,17 @@ class SnoozedChallenge(Base):
 
     __tablename__ = "snoozed_challenges"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=False)
     snoozed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     snoozed_until = Column(DateTime, nullable=False, comment="When challenge becomes available again")
     reason = Column(String, nullable=True, comment="Optional reason for snoozing")
 
-    __table_args__ = (UniqueConstraint("user_id", "challenge_id", name="uq_user_snoozed_challenge"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "challenge_id", name="uq_user_snoozed_challenge"),
+        Index("ix_snoozed_challenges_user_active", "user_id", "snoozed_until"),
+    )
 
     def __repr__(self):
         return f"<SnoozedChallenge(user_id={self.user_id}, challenge_id={self.challenge_id}, until={self.snoozed_until})>"
@@ -1,13 +1,20 @@
 """
 Student-facing Challenge Routes
 """
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+from sqlalchemy import and_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, load_only, raiseload
 
 from app.common.dependencies import get_db
+from app.common.timestamps import DB_UTC_NOW
 from app.auth.models import User
+# Registers Profile so User.profile resolves when the module-level statements
+# below configure the mappers, even when this module is imported on its own
+import app.users.models  # noqa: F401
 from app.auth.utils import get_current_active_user
+from app.challenges.cache import active_challenge_cache, compute_etag
 from app.challenges.models import (
     Challenge,
     Objective,
@@ -17,164 +24,258 @@ from app.challenges.models import (
     ChallengeStatus,
     ObjectiveStatus,
 )
-from app.challenges.schemas import ActiveChallengeResponse, ObjectiveWithProgress
+from app.challenges.schemas import ActiveChallengeResponse, ObjectiveUpdateResponse, ObjectiveWithProgress
 
 router = APIRouter()
 
+# Loader options for the challenge behind ActiveChallengeResponse: only the columns
+# the response renders are fetched, objectives are loaded with their progress by
+# _get_objectives_with_progress, and any relationship access raises instead of
+# silently lazy-loading while the response is built.
+_ACTIVE_CHALLENGE_LOAD = (
+    load_only(
+        Challenge.id,
+        Challenge.title,
+        Challenge.description,
+        Challenge.is_active,
+        Challenge.created_by,
+        Challenge.created_at,
+    ),
+    raiseload("*"),
+)
+
+
+# Hot statements are built once at import; only the bound user_id and challenge_id
+# change per request, so each call skips statement construction and hits the
+# compiled SQL cache.
+
+# Objectives of a challenge in sort order, each outer-joined to one user's progress.
+# Plain rows go straight into the schema; no ORM instances are needed for a read.
+_OBJECTIVES_WITH_PROGRESS = (
+    select(
+        Objective.id,
+        Objective.challenge_id,
+        Objective.title,
+        Objective.description,
+        Objective.points,
+        Objective.sort_order,
+        Objective.is_required,
+        UserObjectiveProgress.id.label("progress_id"),
+        UserObjectiveProgress.status,
+        UserObjectiveProgress.completed_at,
+    )
+    .select_from(Objective)
+    .outerjoin(
+        UserObjectiveProgress,
+        and_(
+            UserObjectiveProgress.objective_id == Objective.id,
+            UserObjectiveProgress.user_id == bindparam("user_id"),
+        ),
+    )
+    .where(Objective.challenge_id == bindparam("challenge_id"))
+    .order_by(Objective.sort_order)
+)
+
+
+# The user's IN_PROGRESS progress row together with its challenge
+_IN_PROGRESS_CHALLENGE = (
+    select(UserChallengeProgress, Challenge)
+    .join(Challenge, Challenge.id == UserChallengeProgress.challenge_id)
+    .options(*_ACTIVE_CHALLENGE_LOAD)
+    .where(
+        UserChallengeProgress.user_id == bindparam("user_id"),
+        UserChallengeProgress.status == ChallengeStatus.IN_PROGRESS,
+    )
+    .limit(1)
+)
+
+# First active challenge, in (sort_order, id) order, the user hasn't completed
+_FIRST_AVAILABLE_CHALLENGE = (
+    select(Challenge)
+    .options(*_ACTIVE_CHALLENGE_LOAD)
+    .where(
+        Challenge.is_active == True,
+        ~select(UserChallengeProgress.id)
+        .where(
+            UserChallengeProgress.user_id == bindparam("user_id"),
+            UserChallengeProgress.challenge_id == Challenge.id,
+            UserChallengeProgress.status == ChallengeStatus.COMPLETE,
+        )
+        .exists(),
+    )
+    .order_by(Challenge.sort_order, Challenge.id)
+    .limit(1)
+)
+
+
+def _activate_challenge(db: Session, user_id: int, challenge_id: int) -> UserChallengeProgress:
+    """
+    Mark the user's progress on a challenge IN_PROGRESS with a single upsert.
+    The first start time is kept if the row already exists.
+    """
+    insert_stmt = pg_insert(UserChallengeProgress).values(
+        user_id=user_id,
+        challenge_id=challenge_id,
+        status=ChallengeStatus.IN_PROGRESS,
+        started_at=DB_UTC_NOW,
+    )
+    stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[UserChallengeProgress.user_id, UserChallengeProgress.challenge_id],
+        set_={
+            "status": insert_stmt.excluded.status,
+            "started_at": func.coalesce(UserChallengeProgress.started_at, insert_stmt.excluded.started_at),
+        },
+    ).returning(UserChallengeProgress)
+    return db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
 
 def get_or_assign_active_challenge(db: Session, user_id: int) -> tuple[Challenge, UserChallengeProgress]:
     """
     Get the user's active challenge or assign the first available one.
-    Returns (Challenge, UserChallengeProgress)
+    Returns (Challenge, UserChallengeProgress). Changes are flushed, not committed.
     """
-    # Check if user has an IN_PROGRESS challenge
-    in_progress = (
-        db.query(UserChallengeProgress)
-        .filter(
-            UserChallengeProgress.user_id == user_id,
-            UserChallengeProgress.status == ChallengeStatus.IN_PROGRESS,
-        )
-        .first()
-    )
+    # Check if user has an IN_PROGRESS challenge (progress and challenge in one query)
+    in_progress_row = db.execute(_IN_PROGRESS_CHALLENGE, {"user_id": user_id}).first()
 
-    if in_progress:
-        challenge = db.query(Challenge).filter(Challenge.id == in_progress.challenge_id).first()
+    if in_progress_row:
+        in_progress, challenge = in_progress_row
         return challenge, in_progress
 
     # No IN_PROGRESS challenge, find the first active challenge user hasn't completed
-    completed_challenge_ids = (
-        db.query(UserChallengeProgress.challenge_id)
-        .filter(
-            UserChallengeProgress.user_id == user_id,
-            UserChallengeProgress.status == ChallengeStatus.COMPLETE,
-        )
-        .all()
-    )
-    completed_ids = [c[0] for c in completed_challenge_ids]
-
     # Get first active challenge not completed
-    challenge = (
-        db.query(Challenge)
-        .filter(Challenge.is_active == True, ~Challenge.id.in_(completed_ids) if completed_ids else True)
-        .order_by(Challenge.id)
-        .first()
-    )
+    challenge = db.scalars(_FIRST_AVAILABLE_CHALLENGE, {"user_id": user_id}).first()
 
     if not challenge:
         return None, None
 
     # Create or update progress to IN_PROGRESS
-    progress = (
-        db.query(UserChallengeProgress)
-        .filter(
-            UserChallengeProgress.user_id == user_id,
-            UserChallengeProgress.challenge_id == challenge.id,
-        )
-        .first()
-    )
-
-    if not progress:
-        progress = UserChallengeProgress(
-            user_id=user_id,
-            challenge_id=challenge.id,
-            status=ChallengeStatus.IN_PROGRESS,
-            started_at=datetime.utcnow(),
-        )
-        db.add(progress)
-    else:
-        progress.status = ChallengeStatus.IN_PROGRESS
-        if not progress.started_at:
-            progress.started_at = datetime.utcnow()
-
-    db.commit()
-    db.refresh(progress)
+    progress = _activate_challenge(db, user_id, challenge.id)
 
     return challenge, progress
 
 
-@router.get("/me/active-challenge", response_model=ActiveChallengeResponse)
-async def get_active_challenge(
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db),
-):
+def _get_objectives_with_progress(db: Session, user_id: int, challenge_id: int) -> list[ObjectiveWithProgress]:
     """
-    Get the user's current active challenge with objectives and progress
+    Load the challenge's objectives in sort order, each with the user's progress, in one query.
+    Inserts INCOMPLETE progress rows for objectives that have none yet (caller commits).
     """
-    challenge, progress = get_or_assign_active_challenge(db, current_user.id)
-
-    if not challenge:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No active challenges available",
+    rows = db.execute(
+        _OBJECTIVES_WITH_PROGRESS, {"user_id": user_id, "challenge_id": challenge_id}
+    ).mappings().all()
+
+    missing_rows = [
+        {"user_id": user_id, "objective_id": row["id"], "status": ObjectiveStatus.INCOMPLETE}
+        for row in rows
+        if row["progress_id"] is None
+    ]
+    if missing_rows:
+        # One multi-row INSERT; rows a concurrent request created first are skipped
+        # instead of failing on uq_user_objective
+        db.execute(
+            pg_insert(UserObjectiveProgress).on_conflict_do_nothing(
+                index_elements=[UserObjectiveProgress.user_id, UserObjectiveProgress.objective_id],
+            ),
+            missing_rows,
         )
 
-    # Get objectives sorted by sort_order
-    objectives = (
-        db.query(Objective)
-        .filter(Objective.challenge_id == challenge.id)
-        .order_by(Objective.sort_order)
-        .all()
-    )
+    # Column types are already enforced by the database, so skip re-validation
+    return [
+        ObjectiveWithProgress.model_construct(**{**row, "status": row["status"] or ObjectiveStatus.INCOMPLETE})
+        for row in rows
+    ]
 
-    # Get user's objective progress
-    objective_progress_map = {}
-    for obj in objectives:
-        obj_progress = (
-            db.query(UserObjectiveProgress)
-            .filter(
-                UserObjectiveProgress.user_id == current_user.id,
-                UserObjectiveProgress.objective_id == obj.id,
-            )
-            .first()
-        )
-        if obj_progress:
-            objective_progress_map[obj.id] = obj_progress
-        else:
-            # Create NOT_STARTED progress
-            obj_progress = UserObjectiveProgress(
-                user_id=current_user.id,
-                objective_id=obj.id,
-                status=ObjectiveStatus.INCOMPLETE,
-            )
-            db.add(obj_progress)
-            objective_progress_map[obj.id] = obj_progress
-
-    db.commit()
-
-    # Build response
-    objectives_with_progress = []
-    for obj in objectives:
-        obj_progress = objective_progress_map[obj.id]
-        objectives_with_progress.append(
-            ObjectiveWithProgress(
-                id=obj.id,
-                challenge_id=obj.challenge_id,
-                title=obj.title,
-                description=obj.description,
-                points=obj.points,
-                sort_order=obj.sort_order,
-                is_required=obj.is_required,
-                status=obj_progress.status,
-                completed_at=obj_progress.completed_at,
-            )
-        )
 
-    return ActiveChallengeResponse(
+def _build_active_challenge_response(
+    db: Session, user_id: int, challenge: Challenge, progress: UserChallengeProgress
+) -> ActiveChallengeResponse:
+    """
+    Assemble the ActiveChallengeResponse for a challenge and the user's progress on it.
+    Objectives and their progress come from one query (see _get_objectives_with_progress).
+    Built with model_construct: every value comes from a typed column.
+    """
+    return ActiveChallengeResponse.model_construct(
         id=challenge.id,
         title=challenge.title,
         description=challenge.description,
         is_active=challenge.is_active,
         created_by=challenge.created_by,
         created_at=challenge.created_at,
-        objectives=objectives_with_progress,
+        objectives=_get_objectives_with_progress(db, user_id, challenge.id),
         status=progress.status,
         started_at=progress.started_at,
         completed_at=progress.completed_at,
     )
 
 
-@router.post("/me/objectives/{objective_id}/complete", response_model=ActiveChallengeResponse)
-async def complete_objective(
+def _all_required_objectives_complete(db: Session, user_id: int, challenge_id: int) -> bool:
+    """Check in one query that no required objective of the challenge lacks a COMPLETE progress row"""
+    incomplete_required = (
+        db.query(Objective.id)
+        .outerjoin(
+            UserObjectiveProgress,
+            and_(
+                UserObjectiveProgress.objective_id == Objective.id,
+                UserObjectiveProgress.user_id == user_id,
+                UserObjectiveProgress.status == ObjectiveStatus.COMPLETE,
+            ),
+        )
+        .filter(
+            Objective.challenge_id == challenge_id,
+            Objective.is_required == True,
+            UserObjectiveProgress.id.is_(None),
+        )
+    )
+    return not db.query(incomplete_required.exists()).scalar()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (a list of entity tags, or *) against an ETag"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+@router.get("/me/active-challenge", response_model=ActiveChallengeResponse)
+def get_active_challenge(
+    http_response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_active_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the user's current active challenge with objectives and progress.
+    Sends an ETag; a matching If-None-Match gets 304 Not Modified.
+    """
+    cache_generation = active_challenge_cache.generation(current_user.id)
+    cached = active_challenge_cache.get(current_user.id)
+    if cached is not None:
+        response, etag = cached
+    else:
+        challenge, progress = get_or_assign_active_challenge(db, current_user.id)
+
+        if not challenge:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No active challenges available",
+            )
+
+        response = _build_active_challenge_response(db, current_user.id, challenge, progress)
+
+        # Commit after building the response so it doesn't reload expired rows one by one
+        db.commit()
+        etag = compute_etag(response)
+        active_challenge_cache.put(current_user.id, (response, etag), cache_generation)
+
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    http_response.headers["ETag"] = etag
+    return response
+
+
+@router.post("/me/objectives/{objective_id}/complete", response_model=ObjectiveUpdateResponse)
+def complete_objective(
     objective_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -182,6 +283,7 @@ async def complete_objective(
     """
     Mark an objective as complete for the current user.
     If all required objectives are complete, mark challenge as complete and activate next challenge.
+    Returns only what changed; clients refetch /me/active-challenge when next_challenge_id is set.
     """
     # Get the objective
     objective = db.query(Objective).filter(Objective.id == objective_id).first()
@@ -191,62 +293,41 @@ async def complete_objective(
             detail="Objective not found",
         )
 
-    # Get or create user objective progress
-    obj_progress = (
-        db.query(UserObjectiveProgress)
-        .filter(
-            UserObjectiveProgress.user_id == current_user.id,
-            UserObjectiveProgress.objective_id == objective_id,
-        )
-        .first()
+    # Mark as complete, creating the progress row if needed, in one statement
+    insert_stmt = pg_insert(UserObjectiveProgress).values(
+        user_id=current_user.id,
+        objective_id=objective_id,
+        status=ObjectiveStatus.COMPLETE,
+        completed_at=DB_UTC_NOW,
     )
-
-    if not obj_progress:
-        obj_progress = UserObjectiveProgress(
-            user_id=current_user.id,
-            objective_id=objective_id,
-        )
-        db.add(obj_progress)
-
-    # Mark as complete
-    obj_progress.status = ObjectiveStatus.COMPLETE
-    obj_progress.completed_at = datetime.utcnow()
-    db.commit()
+    obj_progress = db.scalars(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[UserObjectiveProgress.user_id, UserObjectiveProgress.objective_id],
+            set_={
+                "status": insert_stmt.excluded.status,
+                "completed_at": insert_stmt.excluded.completed_at,
+            },
+        ).returning(UserObjectiveProgress),
+        execution_options={"populate_existing": True},
+    ).one()
 
     # Check if all required objectives in this challenge are complete
     challenge_id = objective.challenge_id
-    all_objectives = db.query(Objective).filter(Objective.challenge_id == challenge_id).all()
-
-    all_required_complete = True
-    for obj in all_objectives:
-        if obj.is_required:
-            obj_prog = (
-                db.query(UserObjectiveProgress)
-                .filter(
-                    UserObjectiveProgress.user_id == current_user.id,
-                    UserObjectiveProgress.objective_id == obj.id,
-                )
-                .first()
-            )
-            if not obj_prog or obj_prog.status != ObjectiveStatus.COMPLETE:
-                all_required_complete = False
-                break
-
-    # If all required objectives complete, mark challenge as complete
-    if all_required_complete:
-        challenge_progress = (
-            db.query(UserChallengeProgress)
-            .filter(
-                UserChallengeProgress.user_id == current_user.id,
-                UserChallengeProgress.challenge_id == challenge_id,
-            )
-            .first()
+    challenge_progress = (
+        db.query(UserChallengeProgress)
+        .filter(
+            UserChallengeProgress.user_id == current_user.id,
+            UserChallengeProgress.challenge_id == challenge_id,
         )
+        .first()
+    )
+    next_challenge_id = None
 
+    # If all required objectives complete, mark challenge as complete
+    if _all_required_objectives_complete(db, current_user.id, challenge_id):
         if challenge_progress:
             challenge_progress.status = ChallengeStatus.COMPLETE
-            challenge_progress.completed_at = datetime.utcnow()
-            db.commit()
+            challenge_progress.completed_at = DB_UTC_NOW
 
         # Find next challenge via challenge_links
         next_link = (
@@ -260,97 +341,34 @@ async def complete_objective(
 
         if next_link:
             # Activate next challenge
+            _activate_challenge(db, current_user.id, next_link.to_challenge_id)
             next_challenge_id = next_link.to_challenge_id
-            next_progress = (
-                db.query(UserChallengeProgress)
-                .filter(
-                    UserChallengeProgress.user_id == current_user.id,
-                    UserChallengeProgress.challenge_id == next_challenge_id,
-                )
-                .first()
-            )
-
-            if not next_progress:
-                next_progress = UserChallengeProgress(
-                    user_id=current_user.id,
-                    challenge_id=next_challenge_id,
-                    status=ChallengeStatus.IN_PROGRESS,
-                    started_at=datetime.utcnow(),
-                )
-                db.add(next_progress)
-            else:
-                next_progress.status = ChallengeStatus.IN_PROGRESS
-                if not next_progress.started_at:
-                    next_progress.started_at = datetime.utcnow()
-
-            db.commit()
-
-    # Return updated active challenge
-    challenge, progress = get_or_assign_active_challenge(db, current_user.id)
-
-    if not challenge:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="No active challenges available",
-        )
 
-    # Get objectives with progress
-    objectives = (
-        db.query(Objective)
-        .filter(Objective.challenge_id == challenge.id)
-        .order_by(Objective.sort_order)
-        .all()
+    response = ObjectiveUpdateResponse.model_construct(
+        objective=ObjectiveWithProgress.model_construct(
+            id=objective.id,
+            challenge_id=objective.challenge_id,
+            title=objective.title,
+            description=objective.description,
+            points=objective.points,
+            sort_order=objective.sort_order,
+            is_required=objective.is_required,
+            status=obj_progress.status,
+            completed_at=obj_progress.completed_at,
+        ),
+        challenge_status=challenge_progress.status if challenge_progress else ChallengeStatus.NOT_STARTED,
+        next_challenge_id=next_challenge_id,
     )
 
-    objectives_with_progress = []
-    for obj in objectives:
-        obj_progress = (
-            db.query(UserObjectiveProgress)
-            .filter(
-                UserObjectiveProgress.user_id == current_user.id,
-                UserObjectiveProgress.objective_id == obj.id,
-            )
-            .first()
-        )
-        if not obj_progress:
-            obj_progress = UserObjectiveProgress(
-                user_id=current_user.id,
-                objective_id=obj.id,
-                status=ObjectiveStatus.INCOMPLETE,
-            )
-            db.add(obj_progress)
-            db.commit()
-
-        objectives_with_progress.append(
-            ObjectiveWithProgress(
-                id=obj.id,
-                challenge_id=obj.challenge_id,
-                title=obj.title,
-                description=obj.description,
-                points=obj.points,
-                sort_order=obj.sort_order,
-                is_required=obj.is_required,
-                status=obj_progress.status,
-                completed_at=obj_progress.completed_at,
-            )
-        )
+    # Commit after building the response so it doesn't reload expired rows one by one
+    db.commit()
+    active_challenge_cache.invalidate(current_user.id)
 
-    return ActiveChallengeResponse(
-        id=challenge.id,
-        title=challenge.title,
-        description=challenge.description,
-        is_active=challenge.is_active,
-        created_by=challenge.created_by,
-        created_at=challenge.created_at,
-        objectives=objectives_with_progress,
-        status=progress.status,
-        started_at=progress.started_at,
-        completed_at=progress.completed_at,
-    )
+    return response
 
 
 @router.post("/me/next-challenge", response_model=ActiveChallengeResponse)
-async def get_next_challenge(
+def get_next_challenge(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -372,28 +390,7 @@ async def get_next_challenge(
     # If there's an IN_PROGRESS challenge, it must be completed first
     if current_progress:
         # Check if all required objectives are complete
-        current_objectives = (
-            db.query(Objective)
-            .filter(Objective.challenge_id == current_progress.challenge_id)
-            .all()
-        )
-
-        all_required_complete = True
-        for obj in current_objectives:
-            if obj.is_required:
-                obj_prog = (
-                    db.query(UserObjectiveProgress)
-                    .filter(
-                        UserObjectiveProgress.user_id == current_user.id,
-                        UserObjectiveProgress.objective_id == obj.id,
-                    )
-                    .first()
-                )
-                if not obj_prog or obj_prog.status != ObjectiveStatus.COMPLETE:
-                    all_required_complete = False
-                    break
-
-        if not all_required_complete:
+        if not _all_required_objectives_complete(db, current_user.id, current_progress.challenge_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Complete all required objectives in your current challenge before requesting another",
@@ -401,111 +398,35 @@ async def get_next_challenge(
 
         # Mark current challenge as complete
         current_progress.status = ChallengeStatus.COMPLETE
-        current_progress.completed_at = datetime.utcnow()
-        db.commit()
+        current_progress.completed_at = DB_UTC_NOW
+        db.flush()
 
     # Find and activate next challenge
-    completed_challenge_ids = (
-        db.query(UserChallengeProgress.challenge_id)
-        .filter(
-            UserChallengeProgress.user_id == current_user.id,
-            UserChallengeProgress.status == ChallengeStatus.COMPLETE,
-        )
-        .all()
-    )
-    completed_ids = [c[0] for c in completed_challenge_ids]
-
     # Get next active challenge not completed
-    next_challenge = (
-        db.query(Challenge)
-        .filter(Challenge.is_active == True, ~Challenge.id.in_(completed_ids) if completed_ids else True)
-        .order_by(Challenge.id)
-        .first()
-    )
+    next_challenge = db.scalars(_FIRST_AVAILABLE_CHALLENGE, {"user_id": current_user.id}).first()
 
     if not next_challenge:
+        # Keep the current challenge's completion
+        db.commit()
+        active_challenge_cache.invalidate(current_user.id)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No more challenges available. You've completed them all!",
         )
 
     # Create or update progress to IN_PROGRESS
-    next_progress = (
-        db.query(UserChallengeProgress)
-        .filter(
-            UserChallengeProgress.user_id == current_user.id,
-            UserChallengeProgress.challenge_id == next_challenge.id,
-        )
-        .first()
-    )
+    next_progress = _activate_challenge(db, current_user.id, next_challenge.id)
 
-    if not next_progress:
-        next_progress = UserChallengeProgress(
-            user_id=current_user.id,
-            challenge_id=next_challenge.id,
-            status=ChallengeStatus.IN_PROGRESS,
-            started_at=datetime.utcnow(),
-        )
-        db.add(next_progress)
-    else:
-        next_progress.status = ChallengeStatus.IN_PROGRESS
-        if not next_progress.started_at:
-            next_progress.started_at = datetime.utcnow()
+    response = _build_active_challenge_response(db, current_user.id, next_challenge, next_progress)
 
+    # Commit after building the response so it doesn't reload expired rows one by one
     db.commit()
-    db.refresh(next_progress)
-
-    # Get objectives with progress
-    objectives = (
-        db.query(Objective)
-        .filter(Objective.challenge_id == next_challenge.id)
-        .order_by(Objective.sort_order)
-        .all()
+    # Invalidate first so a concurrent GET that read the old state can't store it
+    active_challenge_cache.invalidate(current_user.id)
+    active_challenge_cache.put(
+        current_user.id,
+        (response, compute_etag(response)),
+        active_challenge_cache.generation(current_user.id),
     )
 
-    objectives_with_progress = []
-    for obj in objectives:
-        obj_progress = (
-            db.query(UserObjectiveProgress)
-            .filter(
-                UserObjectiveProgress.user_id == current_user.id,
-                UserObjectiveProgress.objective_id == obj.id,
-            )
-            .first()
-        )
-        if not obj_progress:
-            obj_progress = UserObjectiveProgress(
-                user_id=current_user.id,
-                objective_id=obj.id,
-                status=ObjectiveStatus.INCOMPLETE,
-            )
-            db.add(obj_progress)
-            db.commit()
-            db.refresh(obj_progress)
-
-        objectives_with_progress.append(
-            ObjectiveWithProgress(
-                id=obj.id,
-                challenge_id=obj.challenge_id,
-                title=obj.title,
-                description=obj.description,
-                points=obj.points,
-                sort_order=obj.sort_order,
-                is_required=obj.is_required,
-                status=obj_progress.status,
-                completed_at=obj_progress.completed_at,
-            )
-        )
-
-    return ActiveChallengeResponse(
-        id=next_challenge.id,
-        title=next_challenge.title,
-        description=next_challenge.description,
-        is_active=next_challenge.is_active,
-        created_by=next_challenge.created_by,
-        created_at=next_challenge.created_at,
-        objectives=objectives_with_progress,
-        status=next_progress.status,
-        started_at=next_progress.started_at,
-        completed_at=next_progress.completed_at,
-    )
+    return response
@@ -139,6 +139,14 @@ class ActiveChallengeResponse(ChallengeResponse):
     completed_at: Optional[datetime] = None
 
 
+class ObjectiveUpdateResponse(BaseModel):
+    """Schema for the result of completing an objective"""
+
+    objective: ObjectiveWithProgress
+    challenge_status: ChallengeStatus
+    next_challenge_id: Optional[int] = None
+
+
 # Challenge Link Schemas
 class ChallengeLinkCreate(BaseModel):
     """Schema for creating a challenge link"""
@@ -0,0 +1,82 @@
+"""
+Bounded in-process TTL cache for rendered responses
+
+The app runs a single uvicorn process, so an in-process cache stays coherent as
+long as every write invalidates the keys it affects after committing.
+
+A read that misses must not store a response built before a concurrent write
+was committed. Readers take generation(key) before their first query and pass
+it to put(); invalidate() and clear() bump the generation, so a put() from a
+read that overlapped a write is dropped.
+"""
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Thread-safe TTL cache holding at most maxsize entries, oldest evicted first"""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        # Insertion order is expiry order, since every entry gets the same TTL
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[Hashable, int] = {}
+        self._epoch = 0
+        self._lock = Lock()
+
+    def generation(self, key: Hashable) -> tuple[int, int]:
+        """Token to pass to put() for a response built from reads made after this call"""
+        with self._lock:
+            return self._epoch, self._generations.get(key, 0)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for a key, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: Hashable, value: Any, generation: tuple[int, int]) -> bool:
+        """
+        Cache a value for ttl_seconds, unless the key was invalidated since
+        generation was taken. Returns whether the value was stored.
+        """
+        with self._lock:
+            if generation != (self._epoch, self._generations.get(key, 0)):
+                return False
+
+            now = time.monotonic()
+            self._entries.pop(key, None)
+            # Drop expired entries from the front, then the oldest live ones if still full
+            while self._entries:
+                oldest_key, (expires_at, _) = next(iter(self._entries.items()))
+                if expires_at > now and len(self._entries) < self.maxsize:
+                    break
+                del self._entries[oldest_key]
+            self._entries[key] = (now + self.ttl_seconds, value)
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a key's cached value and reject puts from reads already in flight"""
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._generations) >= self.maxsize:
+                # Bound the counters; a new epoch rejects in-flight puts for every key
+                self._generations.clear()
+                self._epoch += 1
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every cached value and reject puts from reads already in flight"""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
@@ -17,6 +17,10 @@ settings = get_settings()
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
     echo=settings.debug,
 )
 
@@ -48,10 +52,10 @@ async def require_admin(current_user: "User" = Depends(_get_current_active_user_
     Usage in routes: current_admin = Depends(require_admin)
 
     This properly uses FastAPI's dependency injection to get the current user
-    and validates they have admin privileges.
+    and validates they have admin privileges. FastAPI caches dependency results
+    per request, so the user row is loaded once even when a route also depends
+    on get_current_active_user directly.
     """
-    from app.auth.models import User
-
     # Check if user is admin
     if not current_user.is_admin:
         raise HTTPException(
@@ -0,0 +1,9 @@
+"""
+Database-side timestamps
+"""
+from sqlalchemy import func
+
+# Current time stamped by the database when the statement runs. The timestamp columns
+# are naive UTC (as datetime.utcnow() produced), hence timezone('utc', ...). Every
+# write to a given column should use this so one clock stamps it.
+DB_UTC_NOW = func.timezone("utc", func.now())
@@ -1,7 +1,7 @@
 """
 Application Configuration
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
@@ -14,6 +14,12 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Sync handlers run in FastAPI's threadpool (40 threads by default), so the
+    # pool should cover a good share of them without exhausting Postgres
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 10
+    db_pool_recycle: int = 1800
 
     # JWT Authentication
     secret_key: str
@@ -23,9 +29,7 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: list[str] = ["*"]
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
 @lru_cache()
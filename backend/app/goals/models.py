@@ -40,7 +40,7 @@ class Goal(Base):
 
     __tablename__ = "goals"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
@@ -55,7 +55,12 @@ class Goal(Base):
     recurrence_count = Column(Integer, default=0, nullable=False, comment="Current recurrence count")
 
     # Relationships
-    steps = relationship("GoalStep", back_populates="goal", cascade="all, delete-orphan")
+    steps = relationship(
+        "GoalStep",
+        back_populates="goal",
+        cascade="all, delete-orphan",
+        order_by="GoalStep.sort_order",
+    )
     links_from = relationship(
         "GoalLink",
         foreign_keys="GoalLink.from_goal_id",
@@ -73,8 +78,8 @@ class GoalStep(Base):
 
     __tablename__ = "goal_steps"
 
-    id = Column(Integer, primary_key=True, index=True)
-    goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     points = Column(Integer, default=0, nullable=False)
@@ -94,9 +99,9 @@ class GoalLink(Base):
 
     __tablename__ = "goal_links"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     from_goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False)
-    to_goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False)
+    to_goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False, index=True)
     condition = Column(String, default="ON_COMPLETE", nullable=False)
 
     # Relationships
@@ -113,9 +118,9 @@ class UserGoalProgress(Base):
 
     __tablename__ = "user_goal_progress"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False)
+    goal_id = Column(Integer, ForeignKey("goals.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(SQLEnum(GoalStatus), default=GoalStatus.NOT_STARTED, nullable=False)
     started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
@@ -134,9 +139,9 @@ class UserGoalStepProgress(Base):
 
     __tablename__ = "user_goal_step_progress"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    step_id = Column(Integer, ForeignKey("goal_steps.id", ondelete="CASCADE"), nullable=False)
+    step_id = Column(Integer, ForeignKey("goal_steps.id", ondelete="CASCADE"), nullable=False, index=True)
     status = Column(SQLEnum(GoalStepStatus), default=GoalStepStatus.INCOMPLETE, nullable=False)
     completed_at = Column(DateTime, nullable=True)
 
@@ -154,7 +159,7 @@ class SnoozedGoalTask(Base):
 
     __tablename__ = "snoozed_goal_tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     step_id = Column(Integer, ForeignKey("goal_steps.id", ondelete="CASCADE"), nullable=False)
     snoozed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
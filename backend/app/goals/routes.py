@@ -3,10 +3,16 @@ Goal Routes
 Admin endpoints for managing goals and steps
 """
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
 
+from app.common.cache import TTLCache
 from app.common.dependencies import get_db, require_admin
 from app.auth.models import User
+# Registers Profile so User.profile resolves when the module-level statements
+# below configure the mappers, even when this module is imported on its own
+import app.users.models  # noqa: F401
 from app.goals.models import Goal, GoalStep, GoalLink
 from app.goals.schemas import (
     GoalCreate,
@@ -22,20 +28,39 @@ from app.goals.schemas import (
 
 router = APIRouter()
 
+# Rendered GET /goals and GET /goals/{goal_id} responses, keyed by _GOAL_LIST_KEY
+# or the goal id. Goals change rarely; every goal or step write clears it.
+goal_cache = TTLCache(ttl_seconds=20, maxsize=1000)
+_GOAL_LIST_KEY = "list"
+
+# Point lookups shared by the goal and step endpoints. SQLAlchemy's compiled cache
+# would reuse the SQL of a select() built per call anyway; building them at import
+# only saves constructing the statement on every request.
+_GOAL_BY_ID = select(Goal).where(Goal.id == bindparam("goal_id"))
+_GOAL_WITH_STEPS_BY_ID = _GOAL_BY_ID.options(selectinload(Goal.steps))
+_STEP_BY_ID = select(GoalStep).where(GoalStep.id == bindparam("step_id"))
+
 
 # Goal Management
 @router.get("/goals", response_model=list[GoalResponse])
-async def list_goals(
+def list_goals(
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """List all goals (admin only)"""
+    cache_generation = goal_cache.generation(_GOAL_LIST_KEY)
+    cached = goal_cache.get(_GOAL_LIST_KEY)
+    if cached is not None:
+        return cached
+
     goals = db.query(Goal).order_by(Goal.id).all()
-    return goals
+    response = [GoalResponse.model_validate(goal) for goal in goals]
+    goal_cache.put(_GOAL_LIST_KEY, response, cache_generation)
+    return response
 
 
 @router.post("/goals", response_model=GoalResponse, status_code=status.HTTP_201_CREATED)
-async def create_goal(
+def create_goal(
     goal_data: GoalCreate,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
@@ -48,22 +73,25 @@ async def create_goal(
         created_by=current_admin.id,
     )
 
+    # Flush to get the id, then render before commit expires the instance
     db.add(goal)
+    db.flush()
+    response = GoalResponse.model_validate(goal)
     db.commit()
-    db.refresh(goal)
+    goal_cache.clear()
 
-    return goal
+    return response
 
 
 @router.put("/goals/{goal_id}", response_model=GoalResponse)
-async def update_goal(
+def update_goal(
     goal_id: int,
     goal_data: GoalUpdate,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """Update a goal (admin only)"""
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    goal = db.scalars(_GOAL_BY_ID, {"goal_id": goal_id}).first()
     if not goal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -75,52 +103,45 @@ async def update_goal(
     for field, value in update_data.items():
         setattr(goal, field, value)
 
+    response = GoalResponse.model_validate(goal)
     db.commit()
-    db.refresh(goal)
+    goal_cache.clear()
 
-    return goal
+    return response
 
 
 @router.get("/goals/{goal_id}", response_model=GoalWithSteps)
-async def get_goal(
+def get_goal(
     goal_id: int,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """Get a goal with steps (admin only)"""
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    cache_generation = goal_cache.generation(goal_id)
+    cached = goal_cache.get(goal_id)
+    if cached is not None:
+        return cached
+
+    goal = db.scalars(_GOAL_WITH_STEPS_BY_ID, {"goal_id": goal_id}).first()
     if not goal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Goal not found",
         )
 
-    steps = (
-        db.query(GoalStep)
-        .filter(GoalStep.goal_id == goal_id)
-        .order_by(GoalStep.sort_order)
-        .all()
-    )
-
-    return GoalWithSteps(
-        id=goal.id,
-        title=goal.title,
-        description=goal.description,
-        is_active=goal.is_active,
-        created_by=goal.created_by,
-        created_at=goal.created_at,
-        steps=steps,
-    )
+    response = GoalWithSteps.model_validate(goal)
+    goal_cache.put(goal_id, response, cache_generation)
+    return response
 
 
 @router.delete("/goals/{goal_id}")
-async def delete_goal(
+def delete_goal(
     goal_id: int,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """Delete a goal (admin only)"""
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    goal = db.scalars(_GOAL_BY_ID, {"goal_id": goal_id}).first()
     if not goal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -130,13 +151,14 @@ async def delete_goal(
     # SQLAlchemy will handle cascade deletes
     db.delete(goal)
     db.commit()
+    goal_cache.clear()
 
     return {"ok": True, "message": f"Goal '{goal.title}' deleted successfully"}
 
 
 # Goal Step Management
 @router.post("/goals/{goal_id}/steps", response_model=GoalStepResponse, status_code=status.HTTP_201_CREATED)
-async def create_step(
+def create_step(
     goal_id: int,
     step_data: GoalStepCreate,
     current_admin: User = Depends(require_admin),
@@ -144,7 +166,7 @@ async def create_step(
 ):
     """Create a step under a goal (admin only)"""
     # Verify goal exists
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    goal = db.scalars(_GOAL_BY_ID, {"goal_id": goal_id}).first()
     if not goal:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -160,22 +182,25 @@ async def create_step(
         is_required=step_data.is_required,
     )
 
+    # Flush to get the id, then render before commit expires the instance
     db.add(step)
+    db.flush()
+    response = GoalStepResponse.model_validate(step)
     db.commit()
-    db.refresh(step)
+    goal_cache.clear()
 
-    return step
+    return response
 
 
 @router.put("/steps/{step_id}", response_model=GoalStepResponse)
-async def update_step(
+def update_step(
     step_id: int,
     step_data: GoalStepUpdate,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """Update a goal step (admin only)"""
-    step = db.query(GoalStep).filter(GoalStep.id == step_id).first()
+    step = db.scalars(_STEP_BY_ID, {"step_id": step_id}).first()
     if not step:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -187,60 +212,51 @@ async def update_step(
     for field, value in update_data.items():
         setattr(step, field, value)
 
+    response = GoalStepResponse.model_validate(step)
     db.commit()
-    db.refresh(step)
+    goal_cache.clear()
 
-    return step
+    return response
 
 
 # Goal Linking
 @router.post("/goals/{goal_id}/link-next", response_model=GoalLinkResponse)
-async def link_next_goal(
+def link_next_goal(
     goal_id: int,
     link_data: GoalLinkCreate,
     current_admin: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """Link a next goal (upsert) (admin only)"""
-    # Verify both goals exist
-    from_goal = db.query(Goal).filter(Goal.id == goal_id).first()
-    if not from_goal:
+    # Verify both goals exist in one round trip
+    found_ids = set(
+        db.scalars(select(Goal.id).where(Goal.id.in_([goal_id, link_data.to_goal_id])))
+    )
+    if goal_id not in found_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Source goal not found",
         )
-
-    to_goal = db.query(Goal).filter(Goal.id == link_data.to_goal_id).first()
-    if not to_goal:
+    if link_data.to_goal_id not in found_ids:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Target goal not found",
         )
 
-    # Check if link already exists
-    existing_link = (
-        db.query(GoalLink)
-        .filter(
-            GoalLink.from_goal_id == goal_id,
-            GoalLink.condition == link_data.condition,
-        )
-        .first()
+    # Upsert on (from_goal_id, condition) in a single statement
+    insert_stmt = pg_insert(GoalLink).values(
+        from_goal_id=goal_id,
+        to_goal_id=link_data.to_goal_id,
+        condition=link_data.condition,
     )
+    link = db.scalars(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[GoalLink.from_goal_id, GoalLink.condition],
+            set_={"to_goal_id": insert_stmt.excluded.to_goal_id},
+        ).returning(GoalLink),
+        execution_options={"populate_existing": True},
+    ).one()
+    response = GoalLinkResponse.model_validate(link)
+    db.commit()
 
-    if existing_link:
-        # Update existing link
-        existing_link.to_goal_id = link_data.to_goal_id
-        db.commit()
-        db.refresh(existing_link)
-        return existing_link
-    else:
-        # Create new link
-        new_link = GoalLink(
-            from_goal_id=goal_id,
-            to_goal_id=link_data.to_goal_id,
-            condition=link_data.condition,
-        )
-        db.add(new_link)
-        db.commit()
-        db.refresh(new_link)
-        return new_link
+    return response
@@ -2,12 +2,15 @@
 Goal Student Routes
 Student-facing endpoints for goals and tasks
 """
+from collections import defaultdict
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, bindparam, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.common.dependencies import get_db
+from app.common.timestamps import DB_UTC_NOW
 from app.auth.models import User
 from app.auth.utils import get_current_active_user
 from app.goals.models import (
@@ -20,7 +23,7 @@ from app.goals.models import (
     GoalStepStatus,
 )
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 # Schemas
@@ -38,8 +41,7 @@ class TaskDetail(BaseModel):
     completed_at: Optional[datetime] = None
     snoozed_until: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TodayTaskResponse(BaseModel):
@@ -51,6 +53,9 @@ class TodayTaskResponse(BaseModel):
 
 router = APIRouter()
 
+# Task lookup shared by the complete and snooze endpoints
+_TASK_BY_ID = select(GoalStep).where(GoalStep.id == bindparam("task_id"))
+
 
 def _get_eligible_tasks(db: Session, user_id: int, exclude_task_ids: list[int] = None) -> list[tuple[GoalStep, Goal]]:
     """
@@ -63,53 +68,47 @@ def _get_eligible_tasks(db: Session, user_id: int, exclude_task_ids: list[int] =
 
     # Get all active goals
     active_goals = db.query(Goal).filter(Goal.is_active == True).all()
+    if not active_goals:
+        return []
+
+    # Get every task of those goals, ordered by sort_order within each goal
+    tasks_by_goal = defaultdict(list)
+    tasks = (
+        db.query(GoalStep)
+        .filter(GoalStep.goal_id.in_([goal.id for goal in active_goals]))
+        .order_by(GoalStep.goal_id, GoalStep.sort_order)
+        .all()
+    )
+    for task in tasks:
+        tasks_by_goal[task.goal_id].append(task)
+    task_ids = [task.id for task in tasks]
+
+    # Completed and still-snoozed tasks, each in one query
+    completed_ids = {
+        step_id
+        for (step_id,) in db.query(UserGoalStepProgress.step_id).filter(
+            UserGoalStepProgress.user_id == user_id,
+            UserGoalStepProgress.step_id.in_(task_ids),
+            UserGoalStepProgress.status == GoalStepStatus.COMPLETE,
+        )
+    }
+    snoozed_ids = {
+        step_id
+        for (step_id,) in db.query(SnoozedGoalTask.step_id).filter(
+            SnoozedGoalTask.user_id == user_id,
+            SnoozedGoalTask.step_id.in_(task_ids),
+            SnoozedGoalTask.snoozed_until > now,  # Still snoozed
+        )
+    }
 
     eligible_tasks = []
 
     for goal in active_goals:
-        # Get all tasks for this goal, ordered by sort_order
-        tasks = (
-            db.query(GoalStep)
-            .filter(GoalStep.goal_id == goal.id)
-            .order_by(GoalStep.sort_order)
-            .all()
-        )
-
-        for task in tasks:
-            # Skip if in exclude list
-            if task.id in exclude_task_ids:
+        for task in tasks_by_goal[goal.id]:
+            # Skip excluded, completed and snoozed tasks
+            if task.id in exclude_task_ids or task.id in completed_ids or task.id in snoozed_ids:
                 continue
 
-            # Check if task is completed
-            progress = (
-                db.query(UserGoalStepProgress)
-                .filter(
-                    and_(
-                        UserGoalStepProgress.user_id == user_id,
-                        UserGoalStepProgress.step_id == task.id,
-                        UserGoalStepProgress.status == GoalStepStatus.COMPLETE,
-                    )
-                )
-                .first()
-            )
-            if progress:
-                continue  # Skip completed tasks
-
-            # Check if task is snoozed
-            snoozed = (
-                db.query(SnoozedGoalTask)
-                .filter(
-                    and_(
-                        SnoozedGoalTask.user_id == user_id,
-                        SnoozedGoalTask.step_id == task.id,
-                        SnoozedGoalTask.snoozed_until > now,  # Still snoozed
-                    )
-                )
-                .first()
-            )
-            if snoozed:
-                continue  # Skip snoozed tasks
-
             # Task is eligible
             eligible_tasks.append((task, goal))
             break  # Only take first eligible task from each goal
@@ -119,28 +118,31 @@ def _get_eligible_tasks(db: Session, user_id: int, exclude_task_ids: list[int] =
 
 def _get_task_detail(task: GoalStep, goal: Goal, user_id: int, db: Session) -> TaskDetail:
     """Convert a GoalStep to TaskDetail with progress info"""
-    # Get completion status
-    progress = (
-        db.query(UserGoalStepProgress)
-        .filter(
+    # Completion and snooze status in one round trip; both tables are unique
+    # on (user_id, step_id), so this yields exactly one row
+    progress_status, completed_at, snoozed_until = (
+        db.query(
+            UserGoalStepProgress.status,
+            UserGoalStepProgress.completed_at,
+            SnoozedGoalTask.snoozed_until,
+        )
+        .select_from(GoalStep)
+        .outerjoin(
+            UserGoalStepProgress,
             and_(
+                UserGoalStepProgress.step_id == GoalStep.id,
                 UserGoalStepProgress.user_id == user_id,
-                UserGoalStepProgress.step_id == task.id,
-            )
+            ),
         )
-        .first()
-    )
-
-    # Get snooze status
-    snoozed = (
-        db.query(SnoozedGoalTask)
-        .filter(
+        .outerjoin(
+            SnoozedGoalTask,
             and_(
+                SnoozedGoalTask.step_id == GoalStep.id,
                 SnoozedGoalTask.user_id == user_id,
-                SnoozedGoalTask.step_id == task.id,
-            )
+            ),
         )
-        .first()
+        .filter(GoalStep.id == task.id)
+        .one()
     )
 
     return TaskDetail(
@@ -152,33 +154,27 @@ def _get_task_detail(task: GoalStep, goal: Goal, user_id: int, db: Session) -> T
         points=task.points,
         sort_order=task.sort_order,
         is_required=task.is_required,
-        is_completed=progress.status == GoalStepStatus.COMPLETE if progress else False,
-        completed_at=progress.completed_at if progress else None,
-        snoozed_until=snoozed.snoozed_until if snoozed else None,
+        is_completed=progress_status == GoalStepStatus.COMPLETE,
+        completed_at=completed_at,
+        snoozed_until=snoozed_until,
     )
 
 
 def _get_goal_progress(goal: Goal, user_id: int, db: Session) -> dict:
     """Get progress stats for a goal"""
-    all_tasks = db.query(GoalStep).filter(GoalStep.goal_id == goal.id).all()
-    completed_count = 0
-
-    for task in all_tasks:
-        progress = (
-            db.query(UserGoalStepProgress)
-            .filter(
-                and_(
-                    UserGoalStepProgress.user_id == user_id,
-                    UserGoalStepProgress.step_id == task.id,
-                    UserGoalStepProgress.status == GoalStepStatus.COMPLETE,
-                )
-            )
-            .first()
+    total_count, completed_count = (
+        db.query(func.count(GoalStep.id), func.count(UserGoalStepProgress.id))
+        .outerjoin(
+            UserGoalStepProgress,
+            and_(
+                UserGoalStepProgress.step_id == GoalStep.id,
+                UserGoalStepProgress.user_id == user_id,
+                UserGoalStepProgress.status == GoalStepStatus.COMPLETE,
+            ),
         )
-        if progress:
-            completed_count += 1
-
-    total_count = len(all_tasks)
+        .filter(GoalStep.goal_id == goal.id)
+        .one()
+    )
     percentage = round((completed_count / total_count * 100)) if total_count > 0 else 0
 
     return {
@@ -191,7 +187,7 @@ def _get_goal_progress(goal: Goal, user_id: int, db: Session) -> dict:
 
 
 @router.get("/student/today-task", response_model=TodayTaskResponse)
-async def get_today_task(
+def get_today_task(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -221,7 +217,7 @@ async def get_today_task(
 
 
 @router.post("/student/today-task/{task_id}/complete")
-async def complete_task(
+def complete_task(
     task_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -231,72 +227,64 @@ async def complete_task(
     Awards points and unlocks next task in the goal.
     """
     # Verify task exists
-    task = db.query(GoalStep).filter(GoalStep.id == task_id).first()
+    task = db.scalars(_TASK_BY_ID, {"task_id": task_id}).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    # Get or create progress
-    progress = (
-        db.query(UserGoalStepProgress)
-        .filter(
-            and_(
-                UserGoalStepProgress.user_id == current_user.id,
-                UserGoalStepProgress.step_id == task_id,
-            )
-        )
-        .first()
+    # Mark complete in one upsert; a row that is already COMPLETE is left alone
+    # and returns nothing
+    insert_stmt = pg_insert(UserGoalStepProgress).values(
+        user_id=current_user.id,
+        step_id=task_id,
+        status=GoalStepStatus.COMPLETE,
+        completed_at=DB_UTC_NOW,
     )
-
-    if not progress:
-        progress = UserGoalStepProgress(
-            user_id=current_user.id,
-            step_id=task_id,
-            status=GoalStepStatus.COMPLETE,
-            completed_at=datetime.utcnow(),
-        )
-        db.add(progress)
-    else:
-        if progress.status == GoalStepStatus.COMPLETE:
-            return {
-                "ok": True,
-                "message": "Task already completed",
-                "points_awarded": 0,
-            }
-        progress.status = GoalStepStatus.COMPLETE
-        progress.completed_at = datetime.utcnow()
+    marked = db.execute(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[UserGoalStepProgress.user_id, UserGoalStepProgress.step_id],
+            set_={
+                "status": insert_stmt.excluded.status,
+                "completed_at": insert_stmt.excluded.completed_at,
+            },
+            where=UserGoalStepProgress.status != GoalStepStatus.COMPLETE,
+        ).returning(UserGoalStepProgress.id)
+    ).first()
+
+    if marked is None:
+        return {
+            "ok": True,
+            "message": "Task already completed",
+            "points_awarded": 0,
+        }
 
     db.commit()
 
     # Award points (could be enhanced to update user.total_points)
     points_awarded = task.points
 
-    # Check if goal is complete
-    goal = db.query(Goal).filter(Goal.id == task.goal_id).first()
-    all_tasks = db.query(GoalStep).filter(GoalStep.goal_id == task.goal_id).all()
-
-    all_complete = True
-    for t in all_tasks:
-        if not t.is_required:
-            continue
-        p = (
-            db.query(UserGoalStepProgress)
-            .filter(
-                and_(
-                    UserGoalStepProgress.user_id == current_user.id,
-                    UserGoalStepProgress.step_id == t.id,
-                    UserGoalStepProgress.status == GoalStepStatus.COMPLETE,
-                )
-            )
-            .first()
+    # Check if goal is complete: no required task is left without a COMPLETE row
+    incomplete_required = (
+        db.query(GoalStep.id)
+        .outerjoin(
+            UserGoalStepProgress,
+            and_(
+                UserGoalStepProgress.step_id == GoalStep.id,
+                UserGoalStepProgress.user_id == current_user.id,
+            ),
         )
-        if not p:
-            all_complete = False
-            break
-
-    goal_complete = all_complete
+        .filter(
+            GoalStep.goal_id == task.goal_id,
+            GoalStep.is_required == True,
+            or_(
+                UserGoalStepProgress.id == None,
+                UserGoalStepProgress.status != GoalStepStatus.COMPLETE,
+            ),
+        )
+    )
+    goal_complete = not db.query(incomplete_required.exists()).scalar()
 
     return {
         "ok": True,
@@ -307,7 +295,7 @@ async def complete_task(
 
 
 @router.post("/student/today-task/{task_id}/snooze")
-async def snooze_task(
+def snooze_task(
     task_id: int,
     days: int = Query(1, ge=1, le=30, description="Number of days to snooze"),
     current_user: User = Depends(get_current_active_user),
@@ -318,7 +306,7 @@ async def snooze_task(
     Task will not appear in today-task until snooze expires.
     """
     # Verify task exists
-    task = db.query(GoalStep).filter(GoalStep.id == task_id).first()
+    task = db.scalars(_TASK_BY_ID, {"task_id": task_id}).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -343,7 +331,7 @@ async def snooze_task(
     if existing_snooze:
         # Update existing snooze
         existing_snooze.snoozed_until = snoozed_until
-        existing_snooze.snoozed_at = datetime.utcnow()
+        existing_snooze.snoozed_at = DB_UTC_NOW
     else:
         # Create new snooze
         snooze = SnoozedGoalTask(
@@ -363,7 +351,7 @@ async def snooze_task(
 
 
 @router.post("/student/today-task/add-another", response_model=TodayTaskResponse)
-async def add_another_task(
+def add_another_task(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -393,7 +381,7 @@ async def add_another_task(
 
 
 @router.post("/student/today-task/swap", response_model=TodayTaskResponse)
-async def swap_task(
+def swap_task(
     current_task_id: int = Query(..., description="ID of current task to swap away from"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
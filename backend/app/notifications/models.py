@@ -7,10 +7,12 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     Enum as SQLEnum,
+    text,
 )
 from sqlalchemy.orm import relationship
 import enum
@@ -31,7 +33,7 @@ class Notification(Base):
 
     __tablename__ = "notifications"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     type = Column(SQLEnum(NotificationType), nullable=False)
     title = Column(String, nullable=False)
@@ -42,13 +44,51 @@ class Notification(Base):
     related_challenge_id = Column(Integer, ForeignKey("challenges.id", ondelete="CASCADE"), nullable=True)
 
     # Scheduling and state
-    scheduled_for = Column(DateTime, nullable=False, index=True, comment="When notification should be shown")
+    scheduled_for = Column(DateTime, nullable=False, comment="When notification should be shown")
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     read_at = Column(DateTime, nullable=True, comment="When user read the notification")
     dismissed_at = Column(DateTime, nullable=True, comment="When user dismissed the notification")
 
     # Deduplication key to prevent duplicate notifications
-    dedup_key = Column(String, nullable=True, index=True, comment="Unique key for deduplication (e.g., 'deadline:challenge:123:2024-01-15')")
+    dedup_key = Column(String, nullable=True, comment="Unique key for deduplication (e.g., 'deadline:challenge:123:2024-01-15')")
+
+    __table_args__ = (
+        Index(
+            "ix_notifications_user_pending",
+            "user_id",
+            "scheduled_for",
+            postgresql_where=text("read_at IS NULL AND dismissed_at IS NULL"),
+        ),
+        Index(
+            "uq_notifications_user_dedup_key",
+            "user_id",
+            "dedup_key",
+            unique=True,
+            postgresql_where=text("dedup_key IS NOT NULL"),
+        ),
+        Index(
+            "ix_notifications_related_challenge_id",
+            "related_challenge_id",
+            postgresql_where=text("related_challenge_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_notifications_related_goal_id",
+            "related_goal_id",
+            postgresql_where=text("related_goal_id IS NOT NULL"),
+        ),
+        Index(
+            "ix_notifications_scheduled_for_brin",
+            "scheduled_for",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
+        Index(
+            "ix_notifications_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
+    )
 
     def __repr__(self):
         return f"<Notification(id={self.id}, type={self.type}, user_id={self.user_id})>"
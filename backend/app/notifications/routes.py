@@ -7,7 +7,7 @@ Endpoints for fetching and managing notifications
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.common.dependencies import get_db
 from app.auth.models import User
@@ -35,8 +35,7 @@ class NotificationResponse(BaseModel):
     is_dismissed: bool
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class NotificationListResponse(BaseModel):
@@ -45,7 +44,7 @@ class NotificationListResponse(BaseModel):
 
 
 @router.get("/me/notifications", response_model=NotificationListResponse)
-async def get_notifications(
+def get_notifications(
     limit: int = 20,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -84,7 +83,7 @@ async def get_notifications(
 
 
 @router.post("/me/notifications/{notification_id}/read")
-async def mark_notification_read(
+def mark_notification_read(
     notification_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -102,7 +101,7 @@ async def mark_notification_read(
 
 
 @router.post("/me/notifications/{notification_id}/dismiss")
-async def dismiss_notification(
+def dismiss_notification(
     notification_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -120,7 +119,7 @@ async def dismiss_notification(
 
 
 @router.post("/me/notifications/generate")
-async def generate_notifications(
+def generate_notifications(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -16,6 +16,7 @@ Principles:
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.notifications.models import Notification, NotificationType
 from app.challenges.models import Challenge, UserChallengeProgress, ChallengeStatus
@@ -74,26 +75,19 @@ class NotificationService:
             ]:
                 # Only notify if we're within the reminder window (±12 hours)
                 if abs(days_until_due - days_before) < 0.5:
-                    # Check for deduplication
-                    dedup_key = f"deadline:challenge:{challenge.id}:{days_before}d"
-
-                    existing = db.query(Notification).filter(
-                        Notification.user_id == user_id,
-                        Notification.dedup_key == dedup_key,
-                        Notification.scheduled_for >= now - timedelta(days=1),
-                    ).first()
-
-                    if not existing:
-                        notification = Notification(
-                            user_id=user_id,
-                            type=NotificationType.DEADLINE,
-                            title=title_template.format(title=challenge.title),
-                            body=body_template.format(title=challenge.title),
-                            related_challenge_id=challenge.id,
-                            scheduled_for=now,
-                            dedup_key=dedup_key,
-                        )
-                        notifications.append(notification)
+                    # Duplicates are dropped on insert by the (user_id, dedup_key) unique index
+                    dedup_key = f"deadline:challenge:{challenge.id}:{due_date.date()}:{days_before}d"
+
+                    notification = Notification(
+                        user_id=user_id,
+                        type=NotificationType.DEADLINE,
+                        title=title_template.format(title=challenge.title),
+                        body=body_template.format(title=challenge.title),
+                        related_challenge_id=challenge.id,
+                        scheduled_for=now,
+                        dedup_key=dedup_key,
+                    )
+                    notifications.append(notification)
 
         return notifications
 
@@ -130,7 +124,7 @@ class NotificationService:
 
         if not last_activity:
             # No activity yet - send welcome nudge
-            dedup_key = f"nudge:inactivity:{user_id}:welcome"
+            dedup_key = f"nudge:inactivity:{user_id}:welcome:{now.date()}"
             return Notification(
                 user_id=user_id,
                 type=NotificationType.NUDGE,
@@ -192,18 +186,15 @@ class NotificationService:
         # Count consecutive days with completions
         from app.challenges.models import UserObjectiveProgress
 
-        recent_completions = (
-            db.query(func.date(UserObjectiveProgress.completed_at))
+        unique_days = (
+            db.query(func.count(func.distinct(func.date(UserObjectiveProgress.completed_at))))
             .filter(
                 UserObjectiveProgress.user_id == user_id,
                 UserObjectiveProgress.completed_at >= now - timedelta(days=7),
             )
-            .distinct()
-            .all()
+            .scalar()
         )
 
-        unique_days = len(recent_completions)
-
         if unique_days >= 2:
             # User has a streak going - encourage them
             dedup_key = f"streak:encourage:{user_id}:{now.date()}"
@@ -234,16 +225,37 @@ class NotificationService:
     def create_notifications(db: Session, notifications: list[Notification]) -> int:
         """
         Bulk create notifications.
+        Notifications whose dedup_key already exists for the user are skipped.
         Returns count of created notifications.
         """
         if not notifications:
             return 0
 
-        for notification in notifications:
-            db.add(notification)
+        rows = [
+            {
+                "user_id": n.user_id,
+                "type": n.type,
+                "title": n.title,
+                "body": n.body,
+                "related_goal_id": n.related_goal_id,
+                "related_challenge_id": n.related_challenge_id,
+                "scheduled_for": n.scheduled_for,
+                "dedup_key": n.dedup_key,
+            }
+            for n in notifications
+        ]
+        stmt = (
+            pg_insert(Notification)
+            .on_conflict_do_nothing(
+                index_elements=[Notification.user_id, Notification.dedup_key],
+                index_where=Notification.dedup_key.isnot(None),
+            )
+            .returning(Notification.id)
+        )
+        created = db.execute(stmt, rows).all()
 
         db.commit()
-        return len(notifications)
+        return len(created)
 
     @staticmethod
     def mark_as_read(db: Session, notification_id: int, user_id: int) -> bool:
@@ -6,11 +6,14 @@ from datetime import datetime
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.common.dependencies import get_db
+from app.common.timestamps import DB_UTC_NOW
 from app.auth.models import User
 from app.auth.utils import get_current_active_user
+from app.challenges.cache import active_challenge_cache
 from app.challenges.models import (
     Challenge,
     Objective,
@@ -52,47 +55,39 @@ def _get_challenge_chain(db: Session, challenge: Challenge, max_depth: int = 5)
 
 def _get_available_challenges(db: Session, user_id: int, exclude_ids: list = None) -> list:
     """Helper function to get available challenges (not completed, not snoozed, within date range)"""
-    if exclude_ids is None:
-        exclude_ids = []
+    now = datetime.utcnow()
 
-    # Get completed challenge IDs
-    completed_ids = [
-        c[0]
-        for c in db.query(UserChallengeProgress.challenge_id)
+    # Completed and still-snoozed challenges are excluded with NOT EXISTS anti-joins,
+    # so the user's history is never pulled into Python
+    completed = (
+        db.query(UserChallengeProgress.id)
         .filter(
-            and_(
-                UserChallengeProgress.user_id == user_id,
-                UserChallengeProgress.status == ChallengeStatus.COMPLETE,
-            )
+            UserChallengeProgress.user_id == user_id,
+            UserChallengeProgress.challenge_id == Challenge.id,
+            UserChallengeProgress.status == ChallengeStatus.COMPLETE,
         )
-        .all()
-    ]
-
-    # Get snoozed challenge IDs (still snoozed)
-    now = datetime.utcnow()
-    snoozed_ids = [
-        s[0]
-        for s in db.query(SnoozedChallenge.challenge_id)
+        .exists()
+    )
+    snoozed = (
+        db.query(SnoozedChallenge.id)
         .filter(
-            and_(
-                SnoozedChallenge.user_id == user_id,
-                SnoozedChallenge.snoozed_until > now,
-            )
+            SnoozedChallenge.user_id == user_id,
+            SnoozedChallenge.challenge_id == Challenge.id,
+            SnoozedChallenge.snoozed_until > now,
         )
-        .all()
-    ]
-
-    # Combine all exclusions
-    all_excluded = set(completed_ids + snoozed_ids + exclude_ids)
+        .exists()
+    )
 
     # Build filters
     filters = [
         Challenge.is_active == True,
         Challenge.visible_to_students == True,
+        ~completed,
+        ~snoozed,
     ]
 
-    if all_excluded:
-        filters.append(~Challenge.id.in_(all_excluded))
+    if exclude_ids:
+        filters.append(~Challenge.id.in_(exclude_ids))
 
     # Date range filters
     filters.append((Challenge.start_date == None) | (Challenge.start_date <= now))
@@ -106,8 +101,59 @@ def _get_available_challenges(db: Session, user_id: int, exclude_ids: list = Non
     )
 
 
+def _get_objectives_with_progress(db: Session, user_id: int, challenge_id: int) -> list:
+    """Helper function to get a challenge's objectives in order with the user's progress, in one query"""
+    rows = (
+        db.query(Objective, UserObjectiveProgress.status, UserObjectiveProgress.completed_at)
+        .outerjoin(
+            UserObjectiveProgress,
+            and_(
+                UserObjectiveProgress.objective_id == Objective.id,
+                UserObjectiveProgress.user_id == user_id,
+            ),
+        )
+        .filter(Objective.challenge_id == challenge_id)
+        .order_by(Objective.sort_order)
+        .all()
+    )
+
+    return [
+        {
+            "id": obj.id,
+            "title": obj.title,
+            "description": obj.description,
+            "points": obj.points,
+            "sort_order": obj.sort_order,
+            "is_required": obj.is_required,
+            "status": (obj_status or ObjectiveStatus.INCOMPLETE).value,
+            "completed_at": completed_at,
+        }
+        for obj, obj_status, completed_at in rows
+    ]
+
+
+def _upsert_challenge_progress(
+    db: Session, user_id: int, challenge_id: int, keep_started_at: bool = False, **values
+) -> UserChallengeProgress:
+    """
+    Insert the user's progress row for a challenge, or update it if one exists, in one statement.
+    With keep_started_at, an existing started_at is left as it was. Returns the resulting row.
+    """
+    insert_stmt = pg_insert(UserChallengeProgress).values(user_id=user_id, challenge_id=challenge_id, **values)
+    set_ = {key: insert_stmt.excluded[key] for key in values}
+    if keep_started_at and "started_at" in set_:
+        set_["started_at"] = func.coalesce(UserChallengeProgress.started_at, insert_stmt.excluded.started_at)
+    return db.scalars(
+        insert_stmt.on_conflict_do_update(
+            index_elements=[UserChallengeProgress.user_id, UserChallengeProgress.challenge_id],
+            set_=set_,
+        ).returning(UserChallengeProgress),
+        execution_options={"populate_existing": True},
+    ).one()
+
+
 @router.get("/student/today")
-async def get_today_task(
+def get_today_task(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -134,8 +180,7 @@ async def get_today_task(
         # Create default preferences
         prefs = UserChallengePreferences(user_id=current_user.id, second_slot_enabled=False)
         db.add(prefs)
-        db.commit()
-        db.refresh(prefs)
+        db.flush()
 
     # Find the student's current IN_PROGRESS challenge
     current_progress = (
@@ -150,11 +195,12 @@ async def get_today_task(
     )
 
     # If no current challenge, try to auto-assign the first available challenge
+    assigned_challenge = False
     if not current_progress:
         available_challenges = _get_available_challenges(db, current_user.id)
 
         if not available_challenges:
-            return {
+            response = {
                 "current_goal": None,
                 "primary_challenge": None,
                 "secondary_challenge": None,
@@ -167,19 +213,22 @@ async def get_today_task(
                 },
                 "second_slot_enabled": prefs.second_slot_enabled,
             }
+            # Keep newly created preferences
+            db.commit()
+            return response
 
         first_challenge = available_challenges[0]
 
-        # Create progress for this challenge
-        current_progress = UserChallengeProgress(
-            user_id=current_user.id,
-            challenge_id=first_challenge.id,
+        # Create or restart progress for this challenge; a NOT_STARTED row can
+        # already exist from an expired snooze or an earlier swap
+        current_progress = _upsert_challenge_progress(
+            db,
+            current_user.id,
+            first_challenge.id,
             status=ChallengeStatus.IN_PROGRESS,
-            started_at=datetime.utcnow(),
+            started_at=DB_UTC_NOW,
         )
-        db.add(current_progress)
-        db.commit()
-        db.refresh(current_progress)
+        assigned_challenge = True
 
     # Get the challenge
     challenge = db.query(Challenge).filter(Challenge.id == current_progress.challenge_id).first()
@@ -194,76 +243,49 @@ async def get_today_task(
     if challenge.goal_id:
         goal = db.query(Goal).filter(Goal.id == challenge.goal_id).first()
 
-    # Get objectives for this challenge
-    objectives = (
-        db.query(Objective)
-        .filter(Objective.challenge_id == challenge.id)
-        .order_by(Objective.sort_order)
-        .all()
-    )
-
-    # Get objective progress
-    objectives_with_progress = []
-    for obj in objectives:
-        obj_progress = (
-            db.query(UserObjectiveProgress)
-            .filter(
-                and_(
-                    UserObjectiveProgress.user_id == current_user.id,
-                    UserObjectiveProgress.objective_id == obj.id,
-                )
-            )
-            .first()
-        )
-
-        objectives_with_progress.append({
-            "id": obj.id,
-            "title": obj.title,
-            "description": obj.description,
-            "points": obj.points,
-            "sort_order": obj.sort_order,
-            "is_required": obj.is_required,
-            "status": obj_progress.status.value if obj_progress else ObjectiveStatus.INCOMPLETE.value,
-            "completed_at": obj_progress.completed_at if obj_progress else None,
-        })
+    # Get objectives for this challenge with their progress
+    objectives_with_progress = _get_objectives_with_progress(db, current_user.id, challenge.id)
 
     # Get all challenges in this goal (if goal exists)
     all_challenges = []
     progress_stats = {"total": 0, "completed": 0, "percentage": 0}
 
     if goal:
-        all_challenges_query = (
-            db.query(Challenge)
+        # Goal's challenges with this user's status, in one query
+        goal_challenge_rows = (
+            db.query(
+                Challenge.id,
+                Challenge.title,
+                Challenge.points,
+                Challenge.sort_order,
+                UserChallengeProgress.status,
+            )
+            .outerjoin(
+                UserChallengeProgress,
+                and_(
+                    UserChallengeProgress.challenge_id == Challenge.id,
+                    UserChallengeProgress.user_id == current_user.id,
+                ),
+            )
             .filter(Challenge.goal_id == goal.id)
             .order_by(Challenge.sort_order, Challenge.id)
             .all()
         )
 
-        for ch in all_challenges_query:
-            ch_progress = (
-                db.query(UserChallengeProgress)
-                .filter(
-                    and_(
-                        UserChallengeProgress.user_id == current_user.id,
-                        UserChallengeProgress.challenge_id == ch.id,
-                    )
-                )
-                .first()
-            )
-
+        for ch in goal_challenge_rows:
+            ch_status = ch.status or ChallengeStatus.NOT_STARTED
             all_challenges.append({
                 "id": ch.id,
                 "title": ch.title,
                 "points": ch.points,
                 "sort_order": ch.sort_order,
-                "status": ch_progress.status.value if ch_progress else ChallengeStatus.NOT_STARTED.value,
+                "status": ch_status.value,
                 "is_current": ch.id == challenge.id,
             })
+            if ch_status == ChallengeStatus.COMPLETE:
+                progress_stats["completed"] += 1
 
-        progress_stats["total"] = len(all_challenges_query)
-        progress_stats["completed"] = sum(
-            1 for ch in all_challenges if ch["status"] == ChallengeStatus.COMPLETE.value
-        )
+        progress_stats["total"] = len(goal_challenge_rows)
         progress_stats["percentage"] = (
             int((progress_stats["completed"] / progress_stats["total"]) * 100)
             if progress_stats["total"] > 0
@@ -278,39 +300,11 @@ async def get_today_task(
     if prefs.second_slot_enabled and prefs.second_slot_challenge_id:
         secondary_challenge = db.query(Challenge).filter(Challenge.id == prefs.second_slot_challenge_id).first()
         if secondary_challenge:
-            # Get objectives for secondary challenge
-            sec_objectives = (
-                db.query(Objective)
-                .filter(Objective.challenge_id == secondary_challenge.id)
-                .order_by(Objective.sort_order)
-                .all()
+            # Get objectives for secondary challenge with their progress
+            sec_objectives_with_progress = _get_objectives_with_progress(
+                db, current_user.id, secondary_challenge.id
             )
 
-            # Get objective progress
-            sec_objectives_with_progress = []
-            for obj in sec_objectives:
-                obj_progress = (
-                    db.query(UserObjectiveProgress)
-                    .filter(
-                        and_(
-                            UserObjectiveProgress.user_id == current_user.id,
-                            UserObjectiveProgress.objective_id == obj.id,
-                        )
-                    )
-                    .first()
-                )
-
-                sec_objectives_with_progress.append({
-                    "id": obj.id,
-                    "title": obj.title,
-                    "description": obj.description,
-                    "points": obj.points,
-                    "sort_order": obj.sort_order,
-                    "is_required": obj.is_required,
-                    "status": obj_progress.status.value if obj_progress else ObjectiveStatus.INCOMPLETE.value,
-                    "completed_at": obj_progress.completed_at if obj_progress else None,
-                })
-
             secondary_challenge_data = {
                 "id": secondary_challenge.id,
                 "title": secondary_challenge.title,
@@ -321,7 +315,7 @@ async def get_today_task(
                 "objectives": sec_objectives_with_progress,
             }
 
-    return {
+    response = {
         "current_goal": {
             "id": goal.id,
             "title": goal.title,
@@ -344,9 +338,17 @@ async def get_today_task(
         "second_slot_enabled": prefs.second_slot_enabled,
     }
 
+    # One commit for new preferences and any auto-assigned challenge, after the
+    # response is built so no expired row has to be reloaded
+    db.commit()
+    if assigned_challenge:
+        active_challenge_cache.invalidate(current_user.id)
+
+    return response
+
 
 @router.post("/student/challenges/{challenge_id}/complete")
-async def complete_challenge(
+def complete_challenge(
     challenge_id: int,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -363,29 +365,29 @@ async def complete_challenge(
             detail="Challenge not found",
         )
 
-    # Get user progress
-    progress = (
-        db.query(UserChallengeProgress)
-        .filter(
-            and_(
-                UserChallengeProgress.user_id == current_user.id,
-                UserChallengeProgress.challenge_id == challenge_id,
-            )
-        )
-        .first()
+    # Mark as complete
+    _upsert_challenge_progress(
+        db,
+        current_user.id,
+        challenge_id,
+        status=ChallengeStatus.COMPLETE,
+        completed_at=DB_UTC_NOW,
     )
 
-    if not progress:
-        progress = UserChallengeProgress(
-            user_id=current_user.id,
-            challenge_id=challenge_id,
+    # If there's a next challenge, activate it
+    if challenge.next_challenge_id:
+        _upsert_challenge_progress(
+            db,
+            current_user.id,
+            challenge.next_challenge_id,
+            keep_started_at=True,
+            status=ChallengeStatus.IN_PROGRESS,
+            started_at=DB_UTC_NOW,
         )
-        db.add(progress)
 
-    # Mark as complete
-    progress.status = ChallengeStatus.COMPLETE
-    progress.completed_at = datetime.utcnow()
+    # Completion and next-challenge activation go out in one transaction
     db.commit()
+    active_challenge_cache.invalidate(current_user.id)
 
     # Generate streak encouragement notification
     try:
@@ -395,34 +397,7 @@ async def complete_challenge(
         # Don't fail the completion if notification generation fails
         print(f"Failed to generate streak notification: {e}")
 
-    # If there's a next challenge, activate it
     if challenge.next_challenge_id:
-        next_progress = (
-            db.query(UserChallengeProgress)
-            .filter(
-                and_(
-                    UserChallengeProgress.user_id == current_user.id,
-                    UserChallengeProgress.challenge_id == challenge.next_challenge_id,
-                )
-            )
-            .first()
-        )
-
-        if not next_progress:
-            next_progress = UserChallengeProgress(
-                user_id=current_user.id,
-                challenge_id=challenge.next_challenge_id,
-                status=ChallengeStatus.IN_PROGRESS,
-                started_at=datetime.utcnow(),
-            )
-            db.add(next_progress)
-        else:
-            next_progress.status = ChallengeStatus.IN_PROGRESS
-            if not next_progress.started_at:
-                next_progress.started_at = datetime.utcnow()
-
-        db.commit()
-
         return {
             "ok": True,
             "message": f"Challenge '{challenge.title}' completed!",
@@ -439,7 +414,7 @@ async def complete_challenge(
 
 
 @router.post("/me/today/add-slot")
-async def add_second_slot(
+def add_second_slot(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -512,7 +487,7 @@ async def add_second_slot(
 
 
 @router.post("/me/today/swap")
-async def swap_challenge(
+def swap_challenge(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -554,31 +529,17 @@ async def swap_challenge(
     # Assign the next available challenge
     new_challenge = available_challenges[0]
 
-    # Check if progress exists for new challenge
-    new_progress = (
-        db.query(UserChallengeProgress)
-        .filter(
-            and_(
-                UserChallengeProgress.user_id == current_user.id,
-                UserChallengeProgress.challenge_id == new_challenge.id,
-            )
-        )
-        .first()
+    # Create or restart progress for the new challenge
+    _upsert_challenge_progress(
+        db,
+        current_user.id,
+        new_challenge.id,
+        status=ChallengeStatus.IN_PROGRESS,
+        started_at=DB_UTC_NOW,
     )
 
-    if not new_progress:
-        new_progress = UserChallengeProgress(
-            user_id=current_user.id,
-            challenge_id=new_challenge.id,
-            status=ChallengeStatus.IN_PROGRESS,
-            started_at=datetime.utcnow(),
-        )
-        db.add(new_progress)
-    else:
-        new_progress.status = ChallengeStatus.IN_PROGRESS
-        new_progress.started_at = datetime.utcnow()
-
     db.commit()
+    active_challenge_cache.invalidate(current_user.id)
 
     return {
         "ok": True,
@@ -595,7 +556,7 @@ async def swap_challenge(
 
 
 @router.post("/me/today/snooze")
-async def snooze_challenge(
+def snooze_challenge(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
     days: int = 1,
@@ -662,6 +623,8 @@ async def snooze_challenge(
     # Mark current challenge as NOT_STARTED
     current_progress.status = ChallengeStatus.NOT_STARTED
     current_progress.started_at = None
+    # Flush so the availability query below sees the snooze
+    db.flush()
 
     # Get next available challenge (excluding snoozed one)
     available_challenges = _get_available_challenges(db, current_user.id)
@@ -669,31 +632,17 @@ async def snooze_challenge(
     if available_challenges:
         new_challenge = available_challenges[0]
 
-        # Create progress for new challenge
-        new_progress = (
-            db.query(UserChallengeProgress)
-            .filter(
-                and_(
-                    UserChallengeProgress.user_id == current_user.id,
-                    UserChallengeProgress.challenge_id == new_challenge.id,
-                )
-            )
-            .first()
+        # Create or restart progress for the new challenge
+        _upsert_challenge_progress(
+            db,
+            current_user.id,
+            new_challenge.id,
+            status=ChallengeStatus.IN_PROGRESS,
+            started_at=DB_UTC_NOW,
         )
 
-        if not new_progress:
-            new_progress = UserChallengeProgress(
-                user_id=current_user.id,
-                challenge_id=new_challenge.id,
-                status=ChallengeStatus.IN_PROGRESS,
-                started_at=datetime.utcnow(),
-            )
-            db.add(new_progress)
-        else:
-            new_progress.status = ChallengeStatus.IN_PROGRESS
-            new_progress.started_at = datetime.utcnow()
-
     db.commit()
+    active_challenge_cache.invalidate(current_user.id)
 
     return {
         "ok": True,
@@ -22,7 +22,7 @@ class Profile(Base):
 
     __tablename__ = "profiles"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), unique=True, nullable=False)
     full_name = Column(String, nullable=True)
     role = Column(SQLEnum(UserRole), nullable=False)
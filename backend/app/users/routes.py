@@ -14,7 +14,7 @@ router = APIRouter()
 
 
 @router.post("/profile", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
-async def create_profile(
+def create_profile(
     profile_data: ProfileCreate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -45,7 +45,7 @@ async def create_profile(
 
 
 @router.get("/profile", response_model=ProfileResponse)
-async def get_profile(
+def get_profile(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):
@@ -61,7 +61,7 @@ async def get_profile(
 
 
 @router.put("/profile", response_model=ProfileResponse)
-async def update_profile(
+def update_profile(
     profile_data: ProfileUpdate,
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
@@ -86,7 +86,7 @@ async def update_profile(
 
 
 @router.delete("/profile", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_profile(
+def delete_profile(
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ):